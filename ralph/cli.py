@@ -1,33 +1,64 @@
 """Ralph CLI - Autonomous Claude Code Agent Runner."""
 
+import functools
 import os
+import sys
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Annotated, Optional
 
 import typer
-from rich.panel import Panel
-from rich.table import Table
 
 from . import __version__
-from .config import RalphConfig, get_project_config_path
-from .executor.retry import RetryConfig
-from .executor.runner import RalphExecutor
-from .generator import (
-    GeneratorContext,
-    PlansGenerator,
-    PRDGenerator,
-)
-from .input.base import InputSource
-from .input.config import ConfigInput
-from .input.plans import PlansInput
-from .input.prd import PRDInput
-from .input.prompt import PromptInput
-from .parser.markdown import MarkdownParser
-from .state.identity import InputType, ProjectIdentifier, ProjectIdentity
-from .state.models import TaskStatus
-from .state.store import StateStore
-from .state.tracker import ProgressTracker
-from .ui import ui
+
+if TYPE_CHECKING:
+    from .input.base import InputSource
+    from .state.identity import ProjectIdentity
+    from .state.models import Project, TaskStatus
+    from .state.store import StateStore
+    from .ui import RalphUI
+
+# Submodules (rich, pexpect, parsers, state) are imported inside the commands
+# that use them so `ralph --help` and light commands start quickly.
+
+# Table style per TaskStatus value (keyed by value so TaskStatus stays lazily imported)
+_STATUS_STYLE = {
+    "pending": "dim",
+    "in_progress": "yellow",
+    "completed": "green",
+    "failed": "red",
+    "blocked": "magenta",
+}
+
+# Status icon per phase status; anything else renders as pending
+_PHASE_ICON = {
+    "completed": "✓",
+    "in_progress": "→",
+}
+
+# History table style per iteration status; anything else renders yellow
+_ITERATION_STYLE = {
+    "success": "green",
+    "failed": "red",
+}
+
+# Rule around the generation banners
+_SEP = "=" * 60
+
+# Options shared by several commands (Typer copies the metadata per command)
+_DIR_OPT = typer.Option("--dir", "-d", help="Working directory")
+_MODEL_OPT = typer.Option("--model", help="Claude model to use")
+_TIMEOUT_OPT = typer.Option("--timeout", "-t", help="Seconds to wait for Claude response")
+_GEN_PROMPT_OPT = typer.Option("--prompt", "-p", help="Prompt describing the feature/project")
+_FROM_FILE_OPT = typer.Option("--from-file", "-f", help="Path to prompt file (.txt, .md)")
+_GEN_NAME_OPT = typer.Option("--name", "-n", help="Project name")
+_GEN_DRY_RUN_OPT = typer.Option("--dry-run", help="Show prompt without generating")
+
+
+def _print_banner(title: str) -> None:
+    """Print a generation banner in one write, ahead of Claude's output."""
+    # Flushed so it lands before the child writes to the terminal directly
+    print(f"\n{_SEP}\n  {title}\n{_SEP}\n", flush=True)
+
 
 app = typer.Typer(
     name="ralph",
@@ -37,117 +68,163 @@ app = typer.Typer(
 )
 
 
+@functools.cache
+def _get_ui() -> "RalphUI":
+    """Return the shared UI instance, importing rich on first use."""
+    from .ui import ui
+
+    return ui
+
+
+@functools.cache
+def _status_by_name() -> dict[str, "TaskStatus"]:
+    """Return TaskStatus members keyed by value, for parsing user input."""
+    from .state.models import TaskStatus
+
+    return {s.value: s for s in TaskStatus}
+
+
+@functools.cache
+def _status_text() -> dict:
+    """Return one styled Text per status value, shared by every table row."""
+    from rich.text import Text
+
+    return {value: Text(value, style=style) for value, style in _STATUS_STYLE.items()}
+
+
+@functools.lru_cache(maxsize=32)
+def _default_plans_dir(working_dir: str) -> Path:
+    """Return the default plans directory for a working directory."""
+    return Path(working_dir, ".ide", "tasks", "plans")
+
+
+@functools.lru_cache(maxsize=32)
+def _state_dir(working_dir: str) -> Path:
+    """Return the Ralph state directory for a working directory."""
+    return Path(working_dir, ".ralph")
+
+
+def _find_state_dir(start: Path) -> Optional[Path]:
+    """Return the Ralph state directory of the nearest project above a path."""
+    for directory in (start, *start.parents):
+        state_dir = directory / ".ralph"
+        if state_dir.is_dir():
+            return state_dir
+    return None
+
+
+@functools.lru_cache(maxsize=32)
+def _projects_dir(working_dir: str) -> Path:
+    """Return the per-project state root for a working directory."""
+    return Path(working_dir, ".ralph", "projects")
+
+
+@functools.lru_cache(maxsize=32)
+def _config_path(working_dir: str) -> Path:
+    """Return the project config path for a working directory."""
+    from .config import get_project_config_path
+
+    return get_project_config_path(working_dir)
+
+
+def _state_mtime_ns(working_dir: str) -> Optional[int]:
+    """Return the state file's mtime in nanoseconds, or None if there is no state."""
+    from .state.store import StateStore
+
+    try:
+        return os.stat(_state_dir(working_dir) / StateStore.DEFAULT_STATE_FILE).st_mtime_ns
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=4)
+def _load_project_cached(
+    working_dir: str, mtime_ns: int
+) -> tuple["StateStore", Optional["Project"]]:
+    """Load project state once per (working directory, state file mtime)."""
+    from .state.store import StateStore
+
+    store = StateStore(working_dir)
+    return store, store.load()
+
+
 def version_callback(value: bool) -> None:
     """Print version and exit."""
     if value:
-        ui.console.print(f"Ralph v{__version__}")
+        print(f"Ralph v{__version__}")
         raise typer.Exit()
 
 
 @app.command()
 def run(
     # Input sources (mutually exclusive)
-    prompt: Optional[str] = typer.Option(
-        None, "--prompt", "-p",
-        help="Direct prompt to execute",
-    ),
-    prd: Optional[str] = typer.Option(
-        None, "--prd",
-        help="PRD markdown file or directory to parse",
-    ),
-    plans: Optional[str] = typer.Option(
-        None, "--plans",
-        help="Directory containing plan files",
-    ),
-    files: Optional[list[str]] = typer.Option(
-        None, "--files", "-f",
-        help="Specific plan files to parse",
-    ),
-    config: Optional[str] = typer.Option(
-        None, "--config", "-c",
-        help="JSON configuration file",
-    ),
-    project_id: Optional[str] = typer.Option(
-        None, "--id",
-        help="Project ID (full or partial) to resume",
-    ),
-    project_name: Optional[str] = typer.Option(
-        None, "--name",
-        help="Project name to resume",
-    ),
+    prompt: Annotated[
+        Optional[str], typer.Option("--prompt", "-p", help="Direct prompt to execute")
+    ] = None,
+    prd: Annotated[
+        Optional[str], typer.Option("--prd", help="PRD markdown file or directory to parse")
+    ] = None,
+    plans: Annotated[
+        Optional[str], typer.Option("--plans", help="Directory containing plan files")
+    ] = None,
+    files: Annotated[
+        Optional[list[str]], typer.Option("--files", "-f", help="Specific plan files to parse")
+    ] = None,
+    config: Annotated[
+        Optional[str], typer.Option("--config", "-c", help="JSON configuration file")
+    ] = None,
+    project_id: Annotated[
+        Optional[str], typer.Option("--id", help="Project ID (full or partial) to resume")
+    ] = None,
+    project_name: Annotated[
+        Optional[str], typer.Option("--name", help="Project name to resume")
+    ] = None,
 
     # Execution settings
-    max_iterations: int = typer.Option(
-        50, "--max", "-m",
-        help="Maximum number of iterations",
-    ),
-    idle_timeout: int = typer.Option(
-        60, "--timeout", "-t",
-        help="Seconds to wait for Claude response",
-    ),
-    sleep_between: int = typer.Option(
-        2, "--sleep", "-s",
-        help="Seconds between iterations",
-    ),
-    retry: int = typer.Option(
-        3, "--retry",
-        help="Max retries on failure",
-    ),
+    max_iterations: Annotated[
+        int, typer.Option("--max", "-m", help="Maximum number of iterations")
+    ] = 50,
+    idle_timeout: Annotated[int, _TIMEOUT_OPT] = 60,
+    sleep_between: Annotated[
+        int, typer.Option("--sleep", "-s", help="Seconds between iterations")
+    ] = 2,
+    retry: Annotated[int, typer.Option("--retry", help="Max retries on failure")] = 3,
 
     # Claude settings
-    model: Optional[str] = typer.Option(
-        None, "--model",
-        help="Claude model to use",
-    ),
-    no_skip_permissions: bool = typer.Option(
-        False, "--no-skip-permissions",
-        help="Don't use --dangerously-skip-permissions",
-    ),
+    model: Annotated[Optional[str], _MODEL_OPT] = None,
+    no_skip_permissions: Annotated[
+        bool, typer.Option("--no-skip-permissions", help="Don't use --dangerously-skip-permissions")
+    ] = False,
 
     # Output settings
-    quiet: bool = typer.Option(
-        False, "--quiet", "-q",
-        help="Minimal output",
-    ),
-    verbose: bool = typer.Option(
-        False, "--verbose", "-v",
-        help="Verbose output",
-    ),
-    log_file: Optional[str] = typer.Option(
-        None, "--log-file",
-        help="Write logs to file",
-    ),
+    quiet: Annotated[bool, typer.Option("--quiet", "-q", help="Minimal output")] = False,
+    verbose: Annotated[bool, typer.Option("--verbose", "-v", help="Verbose output")] = False,
+    log_file: Annotated[
+        Optional[str], typer.Option("--log-file", help="Write logs to file")
+    ] = None,
 
     # Behavior settings
-    dry_run: bool = typer.Option(
-        False, "--dry-run",
-        help="Parse and plan but don't execute",
-    ),
-    no_commit: bool = typer.Option(
-        False, "--no-commit",
-        help="Don't auto-commit changes",
-    ),
-    no_state: bool = typer.Option(
-        False, "--no-state",
-        help="Don't persist state",
-    ),
-    yes: bool = typer.Option(
-        False, "--yes", "-y",
-        help="Auto-confirm prompts",
-    ),
+    dry_run: Annotated[
+        bool, typer.Option("--dry-run", help="Parse and plan but don't execute")
+    ] = False,
+    no_commit: Annotated[
+        bool, typer.Option("--no-commit", help="Don't auto-commit changes")
+    ] = False,
+    no_state: Annotated[bool, typer.Option("--no-state", help="Don't persist state")] = False,
+    yes: Annotated[bool, typer.Option("--yes", "-y", help="Auto-confirm prompts")] = False,
 
     # Working directory
-    working_dir: str = typer.Option(
-        ".", "--dir", "-d",
-        help="Working directory",
-    ),
-
-    version: bool = typer.Option(
-        False, "--version",
-        callback=version_callback,
-        is_eager=True,
-        help="Show version and exit",
-    ),
+    working_dir: Annotated[str, _DIR_OPT] = ".",
+
+    version: Annotated[
+        bool,
+        typer.Option(
+            "--version",
+            callback=version_callback,
+            is_eager=True,
+            help="Show version and exit",
+        ),
+    ] = False,
 ) -> None:
     """
     Run Ralph autonomous agent.
@@ -161,10 +238,19 @@ def run(
         ralph run --plans ./phases/
         ralph run --config ./ralph.json
     """
+    from .input.config import ConfigInput
+    from .input.plans import PlansInput
+    from .input.prd import PRDInput
+    from .input.prompt import PromptInput
+    from .state.identity import ProjectIdentifier
+
+    ui = _get_ui()
     working_dir = os.path.abspath(working_dir)
+    # Decorative rich output (banner, config panel) only when writing to a terminal
+    interactive = not quiet and ui.console.is_terminal
 
     # Print banner
-    if not quiet:
+    if interactive:
         ui.print_banner()
 
     # Validate input - only one source allowed
@@ -205,116 +291,66 @@ def run(
     source_files = []
     project_identity: Optional[ProjectIdentity] = None
 
-    input_source: InputSource
-    if prompt:
-        # Direct prompt
-        input_source = PromptInput(prompt=prompt)
-        result = input_source.parse()
-        if result.is_valid:
-            project = result.project
-            source_files = result.source_files
-            project_identity = ProjectIdentifier.from_prompt(prompt)
-        else:
-            for err in result.errors:
-                ui.print_error(err)
-            raise typer.Exit(1)
-
-    elif prd:
-        # PRD file or directory
-        input_source = PRDInput(prd_path=prd)
-        errors = input_source.validate()
-        if errors:
-            for err in errors:
-                ui.print_error(err)
-            raise typer.Exit(1)
-
-        result = input_source.parse()
-        if result.is_valid:
-            project = result.project
-            source_files = result.source_files
-            project_identity = ProjectIdentifier.from_prd_file(prd, working_dir)
-        else:
-            for err in result.errors:
-                ui.print_error(err)
-            raise typer.Exit(1)
-
-    elif plans:
-        # Plans directory
-        input_source = PlansInput(plans_dir=plans)
-        errors = input_source.validate()
-        if errors:
-            for err in errors:
-                ui.print_error(err)
-            raise typer.Exit(1)
-
-        result = input_source.parse()
-        if result.is_valid:
-            project = result.project
-            source_files = result.source_files
-            project_identity = ProjectIdentifier.from_plans_dir(plans, working_dir)
-        else:
-            for err in result.errors:
-                ui.print_error(err)
-            raise typer.Exit(1)
-
-    elif config:
-        # Config file
-        config_input = ConfigInput(config_file=config)
-        input_source = config_input
-        errors = input_source.validate()
-        if errors:
-            for err in errors:
-                ui.print_error(err)
+    if not (prompt or prd or plans or config):
+        # Default: look for plans directory (single stat, no Path round-trips)
+        default_plans = str(_default_plans_dir(working_dir))
+        try:
+            os.stat(default_plans)
+        except OSError:
+            ui.print_error("No input source specified")
+            ui.console.print(
+                "\nUsage:\n"
+                "  ralph run --prompt 'Your task'\n"
+                "  ralph run --prd ./PRD.md\n"
+                "  ralph run --plans ./plans/\n"
+                "  ralph run --config ./ralph.json"
+            )
             raise typer.Exit(1)
 
-        result = input_source.parse()
+        result = PlansInput(plans_dir=default_plans).parse()
         if result.is_valid:
             project = result.project
             source_files = result.source_files
-            project_identity = ProjectIdentifier.from_config_file(config, working_dir)
-            # Override settings from config
-            if config_input.config:
-                cfg = config_input.config
-                max_iterations = cfg.max_iterations
-                idle_timeout = cfg.idle_timeout
-                sleep_between = cfg.sleep_between
-                retry = cfg.retry_attempts
-                model = cfg.model or model
+            project_identity = ProjectIdentifier.from_plans_dir(default_plans, working_dir)
         else:
-            for err in result.errors:
-                ui.print_error(err)
+            ui.print_error("No input source specified and no default plans found")
+            ui.console.print(
+                "\nUsage:\n"
+                "  ralph run --prompt 'Your task'\n"
+                "  ralph run --prd ./PRD.md\n"
+                "  ralph run --plans ./plans/"
+            )
             raise typer.Exit(1)
 
     else:
-        # Default: look for plans directory
-        default_plans = Path(working_dir) / ".ide" / "tasks" / "plans"
-        if default_plans.exists():
-            input_source = PlansInput(plans_dir=str(default_plans))
-            result = input_source.parse()
-            if result.is_valid:
-                project = result.project
-                source_files = result.source_files
-                project_identity = ProjectIdentifier.from_plans_dir(
-                    str(default_plans), working_dir
-                )
-            else:
-                ui.print_error("No input source specified and no default plans found")
-                ui.console.print("\nUsage:")
-                ui.console.print("  ralph run --prompt 'Your task'")
-                ui.console.print("  ralph run --prd ./PRD.md")
-                ui.console.print("  ralph run --plans ./plans/")
-                raise typer.Exit(1)
-        else:
-            ui.print_error("No input source specified")
-            ui.console.print("\nUsage:")
-            ui.console.print("  ralph run --prompt 'Your task'")
-            ui.console.print("  ralph run --prd ./PRD.md")
-            ui.console.print("  ralph run --plans ./plans/")
-            ui.console.print("  ralph run --config ./ralph.json")
-            raise typer.Exit(1)
+        # Explicit source, in precedence order: (value, input factory, identity factory)
+        sources = (
+            (prompt, lambda v: PromptInput(prompt=v),
+             lambda v: ProjectIdentifier.from_prompt(v)),
+            (prd, lambda v: PRDInput(prd_path=v),
+             lambda v: ProjectIdentifier.from_prd_file(v, working_dir)),
+            (plans, lambda v: PlansInput(plans_dir=v),
+             lambda v: ProjectIdentifier.from_plans_dir(v, working_dir)),
+            (config, lambda v: ConfigInput(config_file=v),
+             lambda v: ProjectIdentifier.from_config_file(v, working_dir)),
+        )
+        source, make_input, make_identity = next(s for s in sources if s[0])
+        assert source is not None  # Selected above
+        input_source = make_input(source)
+        project, source_files = _parse_or_exit(input_source)
+        project_identity = make_identity(source)
+
+        # Override settings from config
+        if isinstance(input_source, ConfigInput) and input_source.config:
+            cfg = input_source.config
+            max_iterations = cfg.max_iterations
+            idle_timeout = cfg.idle_timeout
+            sleep_between = cfg.sleep_between
+            retry = cfg.retry_attempts
+            model = cfg.model or model
 
     # Display configuration
-    if not quiet:
+    if interactive:
         ui.print_config(
             max_iterations=max_iterations,
             idle_timeout=idle_timeout,
@@ -323,11 +359,20 @@ def run(
 
         # Show project summary
         if project:
-            ui.console.print(f"\n[bold]Project:[/bold] {project.name}")
-            total = project.total_tasks
-            completed = project.completed_tasks
-            ui.console.print(f"[bold]Tasks:[/bold] {total} total, {completed} completed")
-            ui.console.print(f"[bold]Phases:[/bold] {len(project.phases)}")
+            total, completed = project.progress_counts
+            ui.console.print(
+                f"\n[bold]Project:[/bold] {project.name}\n"
+                f"[bold]Tasks:[/bold] {total} total, {completed} completed\n"
+                f"[bold]Phases:[/bold] {len(project.phases)}"
+            )
+    elif not quiet and project:
+        # Piped/CI output: plain summary without rich rendering
+        total, completed = project.progress_counts
+        print(
+            f"Project: {project.name}\n"
+            f"Tasks: {total} total, {completed} completed\n"
+            f"Phases: {len(project.phases)}"
+        )
 
     # Dry run - just show what would be done
     if dry_run:
@@ -340,7 +385,10 @@ def run(
         if not typer.confirm("\nStart execution?", default=True):
             raise typer.Exit(0)
 
-    # Create executor
+    # Create executor (imported late so dry runs never load pexpect)
+    from .executor.retry import RetryConfig
+    from .executor.runner import RalphExecutor
+
     retry_config = RetryConfig(max_attempts=retry)
 
     # Project must be set at this point (all code paths either set it or exit)
@@ -360,7 +408,7 @@ def run(
         skip_permissions=not no_skip_permissions,
         commit_prefix="feat:" if not no_commit else "",
         update_source=not no_state,
-        on_output=lambda line: ui.print_claude_line(line) if not quiet else None,
+        on_output=None if quiet else ui.print_claude_line,
         retry_config=retry_config,
         project_identity=project_identity,
     )
@@ -386,6 +434,21 @@ def run(
         raise typer.Exit(130)
 
 
+def _parse_or_exit(input_source: "InputSource") -> tuple[Optional["Project"], list[str]]:
+    """Validate and parse an input source, printing its errors and exiting on failure."""
+    errors = input_source.validate()
+    if not errors:
+        result = input_source.parse()
+        if result.is_valid:
+            return result.project, result.source_files
+        errors = result.errors
+
+    ui = _get_ui()
+    for err in errors:
+        ui.print_error(err)
+    raise typer.Exit(1)
+
+
 def _run_by_id(
     project_id: str,
     working_dir: str,
@@ -400,15 +463,17 @@ def _run_by_id(
     quiet: bool,
     retry: int,
 ) -> None:
-    """Run Ralph by project ID."""
-    working_dir = os.path.abspath(working_dir)
+    """Run Ralph by project ID (working_dir is already absolute)."""
+    from .state.store import StateStore
+
+    ui = _get_ui()
 
     # Load project by ID
     project, identity = StateStore.load_by_project_id(project_id, working_dir)
 
     if not project:
         # Check if ambiguous (multiple matches)
-        base_dir = Path(working_dir) / ".ralph" / "projects"
+        base_dir = _projects_dir(working_dir)
         if base_dir.exists():
             matches = [d for d in base_dir.iterdir()
                       if d.is_dir() and d.name.startswith(project_id)]
@@ -431,11 +496,14 @@ def _run_by_id(
 
     # Show resume info
     if not quiet:
-        ui.print_banner()
-        ui.console.print(f"[bold]Resuming:[/bold] {project.name}")
-        ui.console.print(f"[bold]Project ID:[/bold] {identity.project_id[:8]}...")
-        ui.console.print(f"[bold]Progress:[/bold] {project.completed_tasks}/{project.total_tasks} tasks")
-        ui.console.print()
+        if ui.console.is_terminal:
+            ui.print_banner()
+        total, completed = project.progress_counts
+        ui.console.print(
+            f"[bold]Resuming:[/bold] {project.name}\n"
+            f"[bold]Project ID:[/bold] {identity.project_id[:8]}...\n"
+            f"[bold]Progress:[/bold] {completed}/{total} tasks\n"
+        )
 
     # Confirm execution
     if not yes and not quiet:
@@ -443,6 +511,9 @@ def _run_by_id(
             raise typer.Exit(0)
 
     # Create retry config
+    from .executor.retry import RetryConfig
+    from .executor.runner import RalphExecutor
+
     retry_config = RetryConfig(max_attempts=retry)
 
     # Create executor
@@ -456,7 +527,7 @@ def _run_by_id(
         skip_permissions=not no_skip_permissions,
         commit_prefix="feat:" if not no_commit else "",
         update_source=not no_state,
-        on_output=lambda line: ui.print_claude_line(line) if not quiet else None,
+        on_output=None if quiet else ui.print_claude_line,
         retry_config=retry_config,
         project_identity=identity,
     )
@@ -493,8 +564,10 @@ def _run_by_name(
     quiet: bool,
     retry: int,
 ) -> None:
-    """Run Ralph by project name."""
-    working_dir = os.path.abspath(working_dir)
+    """Run Ralph by project name (working_dir is already absolute)."""
+    from .state.store import StateStore
+
+    ui = _get_ui()
 
     # Find projects by name
     matches = StateStore.find_by_name(project_name, working_dir)
@@ -523,24 +596,29 @@ def _run_by_name(
 
 @app.command()
 def init(
-    working_dir: str = typer.Option(
-        ".", "--dir", "-d",
-        help="Working directory to initialize",
-    ),
+    working_dir: Annotated[
+        str, typer.Option("--dir", "-d", help="Working directory to initialize")
+    ] = ".",
 ) -> None:
     """
     Initialize Ralph in the current project.
 
     Creates configuration and plans directory structure.
     """
+    from .config import RalphConfig
+
+    ui = _get_ui()
     working_dir = os.path.abspath(working_dir)
-    config_path = get_project_config_path(working_dir)
-    plans_dir = Path(working_dir) / ".ide" / "tasks" / "plans"
-    state_dir = Path(working_dir) / ".ralph"
+    plans_dir = _default_plans_dir(working_dir)
+    state_dir = _state_dir(working_dir)
+    config_path = _config_path(working_dir)
 
-    # Create directories
-    if not plans_dir.exists():
+    # Create directories (mkdir doubles as the existence check)
+    try:
         plans_dir.mkdir(parents=True)
+    except FileExistsError:
+        pass
+    else:
         ui.print_status(f"Created plans directory: {plans_dir}")
 
         # Create example plan
@@ -561,8 +639,11 @@ def init(
 """)
         ui.print_status("Created example plan file")
 
-    if not state_dir.exists():
+    try:
         state_dir.mkdir(parents=True)
+    except FileExistsError:
+        pass
+    else:
         ui.print_status(f"Created state directory: {state_dir}")
 
     if not config_path.exists():
@@ -578,29 +659,23 @@ def init(
 
 @app.command()
 def status(
-    working_dir: str = typer.Option(
-        ".", "--dir", "-d",
-        help="Working directory",
-    ),
-    json_output: bool = typer.Option(
-        False, "--json",
-        help="Output as JSON",
-    ),
-    detailed: bool = typer.Option(
-        False, "--detailed",
-        help="Show all tasks",
-    ),
+    working_dir: Annotated[str, _DIR_OPT] = ".",
+    json_output: Annotated[bool, typer.Option("--json", help="Output as JSON")] = False,
+    detailed: Annotated[bool, typer.Option("--detailed", help="Show all tasks")] = False,
 ) -> None:
     """Show Ralph status and progress."""
+    from .state.tracker import ProgressTracker
+
+    ui = _get_ui()
     working_dir = os.path.abspath(working_dir)
-    store = StateStore(working_dir)
+    mtime_ns = _state_mtime_ns(working_dir)
 
-    if not store.exists():
+    if mtime_ns is None:
         ui.console.print("[yellow]No Ralph state found[/yellow]")
         ui.console.print("Run [cyan]ralph run[/cyan] to start")
         raise typer.Exit(0)
 
-    project = store.load()
+    store, project = _load_project_cached(working_dir, mtime_ns)
     if not project:
         ui.console.print("[red]Failed to load state[/red]")
         raise typer.Exit(1)
@@ -608,10 +683,16 @@ def status(
     tracker = ProgressTracker(store)
 
     if json_output:
-        import json
-        ui.console.print(json.dumps(tracker.get_progress(), indent=2))
+        # Machine-readable output bypasses rich
+        from .state import codec
+
+        sys.stdout.buffer.write(codec.dumps(tracker.get_progress(), indent=True) + b"\n")
         return
 
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.table import Table
+
     # Print status panel
     ui.print_banner()
 
@@ -630,21 +711,21 @@ def status(
     status_table.add_row("Progress", f"{completed}/{total} tasks ({pct}%)")
     status_table.add_row("Iterations", str(progress["current_iteration"]))
 
-    ui.console.print(Panel(status_table, title="[bold]Ralph Status[/bold]"))
-
-    # Phase summary
-    ui.console.print("\n[bold]Phases:[/bold]")
+    # Phase summary, rendered together with the panel in a single print
+    phase_lines = ["\n[bold]Phases:[/bold]"]
+    get_icon = _PHASE_ICON.get
     for phase in tracker.get_phases_summary():
-        status = phase["status"]
-        if status == "completed":
-            icon = "✓"
-        elif status == "in_progress":
-            icon = "→"
-        else:
-            icon = "○"
+        icon = get_icon(phase["status"], "○")
         done = phase['tasks_completed']
         total_tasks = phase['tasks_total']
-        ui.console.print(f"  {icon} {phase['name']}: {done}/{total_tasks}")
+        phase_lines.append(f"  {icon} {phase['name']}: {done}/{total_tasks}")
+
+    ui.console.print(
+        Group(
+            Panel(status_table, title="[bold]Ralph Status[/bold]"),
+            "\n".join(phase_lines),
+        )
+    )
 
     if detailed:
         _show_task_list(project)
@@ -652,25 +733,23 @@ def status(
 
 @app.command()
 def resume(
-    working_dir: str = typer.Option(
-        ".", "--dir", "-d",
-        help="Working directory",
-    ),
-    max_iterations: int = typer.Option(
-        50, "--max", "-m",
-        help="Maximum additional iterations",
-    ),
+    working_dir: Annotated[str, _DIR_OPT] = ".",
+    max_iterations: Annotated[
+        int, typer.Option("--max", "-m", help="Maximum additional iterations")
+    ] = 50,
 ) -> None:
     """Resume interrupted Ralph session."""
+
+    ui = _get_ui()
     working_dir = os.path.abspath(working_dir)
-    store = StateStore(working_dir)
+    mtime_ns = _state_mtime_ns(working_dir)
 
-    if not store.exists():
+    if mtime_ns is None:
         ui.console.print("[red]No state to resume[/red]")
         ui.console.print("Run [cyan]ralph run[/cyan] to start")
         raise typer.Exit(1)
 
-    project = store.load()
+    _, project = _load_project_cached(working_dir, mtime_ns)
     if not project:
         ui.console.print("[red]Failed to load state[/red]")
         raise typer.Exit(1)
@@ -681,16 +760,17 @@ def resume(
 
     ui.print_banner()
     ui.console.print(f"[bold]Resuming:[/bold] {project.name}")
-    done = project.completed_tasks
-    total = project.total_tasks
+    total, done = project.progress_counts
     ui.console.print(f"[bold]Progress:[/bold] {done}/{total} tasks")
 
     # Run executor
+    from .executor.runner import RalphExecutor
+
     executor = RalphExecutor(
         project=project,
         working_dir=working_dir,
         max_iterations=max_iterations,
-        on_output=lambda line: ui.print_claude_line(line),
+        on_output=ui.print_claude_line,
     )
 
     try:
@@ -704,24 +784,23 @@ def resume(
 
 @app.command()
 def history(
-    working_dir: str = typer.Option(
-        ".", "--dir", "-d",
-        help="Working directory",
-    ),
-    limit: int = typer.Option(
-        10, "--limit", "-n",
-        help="Number of iterations to show",
-    ),
+    working_dir: Annotated[str, _DIR_OPT] = ".",
+    limit: Annotated[int, typer.Option("--limit", "-n", help="Number of iterations to show")] = 10,
 ) -> None:
     """Show iteration history."""
+    from rich.table import Table
+
+    from .state.tracker import ProgressTracker
+
+    ui = _get_ui()
     working_dir = os.path.abspath(working_dir)
-    store = StateStore(working_dir)
+    mtime_ns = _state_mtime_ns(working_dir)
 
-    if not store.exists():
+    if mtime_ns is None:
         ui.console.print("[yellow]No history found[/yellow]")
         raise typer.Exit(0)
 
-    project = store.load()
+    store, project = _load_project_cached(working_dir, mtime_ns)
     if not project:
         ui.console.print("[yellow]Could not load project history[/yellow]")
         raise typer.Exit(0)
@@ -736,19 +815,17 @@ def history(
     table.add_column("Duration")
     table.add_column("Tasks Completed")
 
+    get_style = _ITERATION_STYLE.get
+    add_row = table.add_row
+
     for it in tracker.get_iteration_history(limit):
         it_status = it["status"]
-        if it_status == "success":
-            status_style = "green"
-        elif it_status == "failed":
-            status_style = "red"
-        else:
-            status_style = "yellow"
-        duration = f"{it['duration_seconds']:.1f}s" if it["duration_seconds"] else "-"
-        table.add_row(
+        status_style = get_style(it_status, "yellow")
+        duration = it["duration_seconds"]
+        add_row(
             str(it["number"]),
-            f"[{status_style}]{it['status']}[/{status_style}]",
-            duration,
+            f"[{status_style}]{it_status}[/{status_style}]",
+            f"{duration:.1f}s" if duration else "-",
             ", ".join(it["tasks_completed"]) or "-"
         )
 
@@ -757,31 +834,31 @@ def history(
 
 @app.command()
 def tasks(
-    working_dir: str = typer.Option(
-        ".", "--dir", "-d",
-        help="Working directory",
-    ),
-    status_filter: Optional[str] = typer.Option(
-        None, "--status",
-        help="Filter by status (pending, completed, failed, blocked)",
-    ),
+    working_dir: Annotated[str, _DIR_OPT] = ".",
+    status_filter: Annotated[
+        Optional[str],
+        typer.Option(
+            "--status",
+            help="Filter by status (pending, completed, failed, blocked)",
+        ),
+    ] = None,
 ) -> None:
     """List all tasks with status."""
+    ui = _get_ui()
     working_dir = os.path.abspath(working_dir)
-    store = StateStore(working_dir)
+    mtime_ns = _state_mtime_ns(working_dir)
 
-    if not store.exists():
+    if mtime_ns is None:
         ui.console.print("[yellow]No tasks found[/yellow]")
         raise typer.Exit(0)
 
-    project = store.load()
+    _, project = _load_project_cached(working_dir, mtime_ns)
 
     # Parse filter
     filter_status = None
     if status_filter:
-        try:
-            filter_status = TaskStatus(status_filter.lower())
-        except ValueError:
+        filter_status = _status_by_name().get(status_filter.lower())
+        if filter_status is None:
             ui.console.print(f"[red]Invalid status: {status_filter}[/red]")
             raise typer.Exit(1)
 
@@ -790,12 +867,13 @@ def tasks(
 
 @app.command()
 def validate(
-    file_path: str = typer.Argument(
-        ...,
-        help="Plan or PRD file to validate",
-    ),
+    file_path: Annotated[str, typer.Argument(help="Plan or PRD file to validate")],
 ) -> None:
     """Validate a plan or PRD file."""
+    from .parser.markdown import MarkdownParser
+    from .state.models import TaskStatus
+
+    ui = _get_ui()
     path = Path(file_path)
 
     if not path.exists():
@@ -804,20 +882,34 @@ def validate(
 
     try:
         parser = MarkdownParser()
-        project = parser.parse_file(file_path)
-
-        ui.console.print(f"\n[green]Valid![/green] {file_path}")
-        ui.console.print(f"\nProject: {project.name}")
-        ui.console.print(f"Phases: {len(project.phases)}")
-        ui.console.print(f"Tasks: {project.total_tasks}")
+        # Reuse parse results across runs when the file's project already has
+        # Ralph state
+        state_dir = _find_state_dir(path.resolve().parent)
+        if state_dir is not None:
+            project = parser.parse_file_cached(file_path, state_dir / "parse-cache")
+        else:
+            project = parser.parse_file(file_path)
+
+        # Assemble the report and print it once instead of once per line
+        lines = [
+            f"\n[green]Valid![/green] {file_path}",
+            f"\nProject: {project.name}",
+            f"Phases: {len(project.phases)}",
+            f"Tasks: {project.total_tasks}",
+        ]
+        append = lines.append
+        completed = TaskStatus.COMPLETED
 
         for phase in project.phases:
-            ui.console.print(f"\n  [bold]{phase.name}[/bold] ({len(phase.tasks)} tasks)")
+            task_count = len(phase.tasks)
+            append(f"\n  [bold]{phase.name}[/bold] ({task_count} tasks)")
             for task in phase.tasks[:5]:
-                icon = "✓" if task.status == TaskStatus.COMPLETED else "○"
-                ui.console.print(f"    {icon} {task.id}: {task.name}")
-            if len(phase.tasks) > 5:
-                ui.console.print(f"    ... and {len(phase.tasks) - 5} more")
+                icon = "✓" if task.status == completed else "○"
+                append(f"    {icon} {task.id}: {task.name}")
+            if task_count > 5:
+                append(f"    ... and {task_count - 5} more")
+
+        ui.console.print("\n".join(lines))
 
     except Exception as e:
         ui.console.print(f"[red]Invalid: {e}[/red]")
@@ -826,23 +918,20 @@ def validate(
 
 @app.command()
 def reset(
-    working_dir: str = typer.Option(
-        ".", "--dir", "-d",
-        help="Working directory",
-    ),
-    yes: bool = typer.Option(
-        False, "--yes", "-y",
-        help="Skip confirmation",
-    ),
+    working_dir: Annotated[str, _DIR_OPT] = ".",
+    yes: Annotated[bool, typer.Option("--yes", "-y", help="Skip confirmation")] = False,
 ) -> None:
     """Reset Ralph state (start fresh)."""
-    working_dir = os.path.abspath(working_dir)
-    store = StateStore(working_dir)
+    from .state.store import StateStore
 
-    if not store.exists():
+    ui = _get_ui()
+    working_dir = os.path.abspath(working_dir)
+    if _state_mtime_ns(working_dir) is None:
         ui.console.print("[yellow]No state to reset[/yellow]")
         raise typer.Exit(0)
 
+    store = StateStore(working_dir)
+
     if not yes:
         if not typer.confirm("Reset all progress?", default=False):
             raise typer.Exit(0)
@@ -855,17 +944,20 @@ def reset(
         pass
 
     store.reset()
+    _load_project_cached.cache_clear()
     ui.console.print("[green]State reset![/green]")
 
 
 @app.command()
 def projects(
-    working_dir: str = typer.Option(
-        ".", "--dir", "-d",
-        help="Working directory",
-    ),
+    working_dir: Annotated[str, _DIR_OPT] = ".",
 ) -> None:
     """List all Ralph projects with their status."""
+    from rich.table import Table
+
+    from .state.store import StateStore
+
+    ui = _get_ui()
     working_dir = os.path.abspath(working_dir)
     projects_list = StateStore.list_projects(working_dir)
 
@@ -923,19 +1015,19 @@ def _get_generator_output_path(
     input_type: str,
     custom_output: Optional[str],
     working_dir: str,
-) -> tuple[str, Optional[ProjectIdentity]]:
+) -> tuple[str, Optional["ProjectIdentity"]]:
     """Determine output path for generators.
 
     Args:
         input_source: Prompt text, file path, or PRD path
         input_type: "prd" or "plans"
         custom_output: User-specified output (or None)
-        working_dir: Working directory
+        working_dir: Absolute working directory
 
     Returns:
         (output_path, project_identity)
     """
-    working_dir = os.path.abspath(working_dir)
+    from .state.identity import InputType, ProjectIdentifier, ProjectIdentity
 
     # If user specified output, use it (no ProjectIdentity)
     if custom_output:
@@ -947,7 +1039,7 @@ def _get_generator_output_path(
 
         # Check if it's inside .ralph/projects/<id>/
         try:
-            base_projects = Path(working_dir) / ".ralph" / "projects"
+            base_projects = _projects_dir(working_dir)
             rel_path = path.relative_to(base_projects)
             # Extract project ID (first path component)
             existing_id = str(rel_path.parts[0])
@@ -974,7 +1066,7 @@ def _get_generator_output_path(
     identity = ProjectIdentifier.from_prompt(input_source)
 
     # Build output path
-    base_dir = Path(working_dir) / ".ralph" / "projects" / identity.project_id
+    base_dir = _projects_dir(working_dir) / identity.project_id
     subdir = "PRDs" if input_type == "prd" else "plans"
     output_path = str(base_dir / subdir)
 
@@ -983,38 +1075,20 @@ def _get_generator_output_path(
 
 @generate_app.command("prd")
 def generate_prd(
-    prompt: Optional[str] = typer.Option(
-        None, "--prompt", "-p",
-        help="Prompt describing the feature/project",
-    ),
-    from_file: Optional[str] = typer.Option(
-        None, "--from-file", "-f",
-        help="Path to prompt file (.txt, .md)",
-    ),
-    output: Optional[str] = typer.Option(
-        None, "--output", "-o",
-        help="Output directory (default: .ralph/projects/<id>/PRDs/)",
-    ),
-    project_name: Optional[str] = typer.Option(
-        None, "--name", "-n",
-        help="Project name",
-    ),
-    model: Optional[str] = typer.Option(
-        None, "--model",
-        help="Claude model to use",
-    ),
-    idle_timeout: int = typer.Option(
-        60, "--timeout", "-t",
-        help="Seconds to wait for Claude response",
-    ),
-    dry_run: bool = typer.Option(
-        False, "--dry-run",
-        help="Show prompt without generating",
-    ),
-    working_dir: str = typer.Option(
-        ".", "--dir", "-d",
-        help="Working directory",
-    ),
+    prompt: Annotated[Optional[str], _GEN_PROMPT_OPT] = None,
+    from_file: Annotated[Optional[str], _FROM_FILE_OPT] = None,
+    output: Annotated[
+        Optional[str],
+        typer.Option(
+            "--output", "-o",
+            help="Output directory (default: .ralph/projects/<id>/PRDs/)",
+        ),
+    ] = None,
+    project_name: Annotated[Optional[str], _GEN_NAME_OPT] = None,
+    model: Annotated[Optional[str], _MODEL_OPT] = None,
+    idle_timeout: Annotated[int, _TIMEOUT_OPT] = 60,
+    dry_run: Annotated[bool, _GEN_DRY_RUN_OPT] = False,
+    working_dir: Annotated[str, _DIR_OPT] = ".",
 ) -> None:
     """
     Generate a PRD (Product Requirements Document) from a prompt.
@@ -1023,6 +1097,9 @@ def generate_prd(
         ralph generate prd --prompt "User authentication system with OAuth"
         ralph generate prd --from-file ./requirements.txt --output ./docs/PRD.md
     """
+    from .generator import GeneratorContext, PRDGenerator
+
+    ui = _get_ui()
     working_dir = os.path.abspath(working_dir)
 
     # Validate input
@@ -1078,9 +1155,7 @@ def generate_prd(
         raise typer.Exit(0)
 
     # Generate
-    print(f"\n{'='*60}")
-    print("  Generating PRD")
-    print(f"{'='*60}\n")
+    _print_banner("Generating PRD")
 
     result = generator.generate(context)
 
@@ -1125,50 +1200,27 @@ def generate_prd(
 
 @generate_app.command("plans")
 def generate_plans(
-    prompt: Optional[str] = typer.Option(
-        None, "--prompt", "-p",
-        help="Prompt describing the feature/project",
-    ),
-    from_file: Optional[str] = typer.Option(
-        None, "--from-file", "-f",
-        help="Path to prompt file (.txt, .md)",
-    ),
-    from_prd: Optional[str] = typer.Option(
-        None, "--from-prd",
-        help="Convert PRD file to plans",
-    ),
-    output: Optional[str] = typer.Option(
-        None, "--output", "-o",
-        help="Output directory (default: .ralph/projects/<id>/plans/)",
-    ),
-    project_name: Optional[str] = typer.Option(
-        None, "--name", "-n",
-        help="Project name",
-    ),
-    phases: Optional[int] = typer.Option(
-        None, "--phases",
-        help="Number of phases to generate (default: auto)",
-    ),
-    max_tasks: int = typer.Option(
-        10, "--max-tasks",
-        help="Maximum tasks per phase",
-    ),
-    model: Optional[str] = typer.Option(
-        None, "--model",
-        help="Claude model to use",
-    ),
-    idle_timeout: int = typer.Option(
-        60, "--timeout", "-t",
-        help="Seconds to wait for Claude response",
-    ),
-    dry_run: bool = typer.Option(
-        False, "--dry-run",
-        help="Show prompt without generating",
-    ),
-    working_dir: str = typer.Option(
-        ".", "--dir", "-d",
-        help="Working directory",
-    ),
+    prompt: Annotated[Optional[str], _GEN_PROMPT_OPT] = None,
+    from_file: Annotated[Optional[str], _FROM_FILE_OPT] = None,
+    from_prd: Annotated[
+        Optional[str], typer.Option("--from-prd", help="Convert PRD file to plans")
+    ] = None,
+    output: Annotated[
+        Optional[str],
+        typer.Option(
+            "--output", "-o",
+            help="Output directory (default: .ralph/projects/<id>/plans/)",
+        ),
+    ] = None,
+    project_name: Annotated[Optional[str], _GEN_NAME_OPT] = None,
+    phases: Annotated[
+        Optional[int], typer.Option("--phases", help="Number of phases to generate (default: auto)")
+    ] = None,
+    max_tasks: Annotated[int, typer.Option("--max-tasks", help="Maximum tasks per phase")] = 10,
+    model: Annotated[Optional[str], _MODEL_OPT] = None,
+    idle_timeout: Annotated[int, _TIMEOUT_OPT] = 60,
+    dry_run: Annotated[bool, _GEN_DRY_RUN_OPT] = False,
+    working_dir: Annotated[str, _DIR_OPT] = ".",
 ) -> None:
     """
     Generate phased implementation plans from a prompt.
@@ -1178,17 +1230,17 @@ def generate_plans(
         ralph generate plans --from-prd ./PRD.md --output ./plans/
         ralph generate plans --from-file ./feature.md --phases 4
     """
+    from .generator import GeneratorContext, PlansGenerator
+
+    ui = _get_ui()
     working_dir = os.path.abspath(working_dir)
 
     # Validate input - need exactly one source
-    sources = [prompt, from_file, from_prd]
-    provided = sum(1 for s in sources if s)
-
-    if provided == 0:
+    if not (prompt or from_file or from_prd):
         ui.print_error("One of --prompt, --from-file, or --from-prd is required")
         raise typer.Exit(1)
 
-    if provided > 1:
+    if (prompt and from_file) or (from_prd and (prompt or from_file)):
         ui.print_error("Only one input source can be specified")
         raise typer.Exit(1)
 
@@ -1226,9 +1278,7 @@ def generate_plans(
             ui.print_error(f"PRD file not found: {from_prd}")
             raise typer.Exit(1)
 
-        print(f"\n{'='*60}")
-        print("  Converting PRD to plans")
-        print(f"{'='*60}\n")
+        _print_banner("Converting PRD to plans")
 
         result = generator.generate_from_prd(
             prd_path=str(prd_path),
@@ -1261,9 +1311,7 @@ def generate_plans(
             ui.console.print(generator.dry_run(context))
             raise typer.Exit(0)
 
-        print(f"\n{'='*60}")
-        print("  Generating phased plans")
-        print(f"{'='*60}\n")
+        _print_banner("Generating phased plans")
         result = generator.generate(context)
 
     if result.success:
@@ -1299,8 +1347,11 @@ def generate_plans(
         raise typer.Exit(1)
 
 
-def _show_task_list(project, status_filter: Optional[TaskStatus] = None) -> None:
+def _show_task_list(project, status_filter: Optional["TaskStatus"] = None) -> None:
     """Display task list in table format."""
+    from rich.table import Table
+    from rich.text import Text
+
     table = Table(title="Tasks")
     table.add_column("ID", style="cyan")
     table.add_column("Name")
@@ -1308,33 +1359,79 @@ def _show_task_list(project, status_filter: Optional[TaskStatus] = None) -> None
     table.add_column("Status")
     table.add_column("Iteration")
 
+    get_cell = _status_text().get
+    add_row = table.add_row
+    no_iteration = Text("-")
+
     for phase in project.phases:
+        # Cells are Text, not str, so Rich skips markup parsing and brackets
+        # in task or phase names render literally
+        phase_name = Text(phase.name[:20])
         for task in phase.tasks:
             if status_filter and task.status != status_filter:
                 continue
 
-            status_style = {
-                TaskStatus.PENDING: "dim",
-                TaskStatus.IN_PROGRESS: "yellow",
-                TaskStatus.COMPLETED: "green",
-                TaskStatus.FAILED: "red",
-                TaskStatus.BLOCKED: "magenta",
-            }.get(task.status, "")
-
-            table.add_row(
-                task.id,
-                task.name[:40] + "..." if len(task.name) > 40 else task.name,
-                phase.name[:20],
-                f"[{status_style}]{task.status.value}[/{status_style}]",
-                str(task.iteration) if task.iteration else "-"
+            value = task.status.value
+            name = task.name
+            if len(name) > 40:
+                name = name[:37] + "..."
+
+            add_row(
+                Text(task.id),
+                Text(name),
+                phase_name,
+                get_cell(value, value),
+                Text(str(task.iteration)) if task.iteration else no_iteration
             )
 
-    ui.console.print(table)
+    _get_ui().console.print(table)
+
+
+# Fixed argument vectors answered without building the Click command tree
+_VERSION_ARGV = (("--version",), ("run", "--version"))
+
+
+def _sniff_subcommand(argv: list[str]) -> Optional[str]:
+    """Return the top-level command named by argv[1], if it is a registered one."""
+    if len(argv) < 2:
+        return None
+    name = argv[1]
+    if any(g.name == name for g in app.registered_groups):
+        return name
+    if any((c.name or c.callback.__name__) == name for c in app.registered_commands if c.callback):
+        return name
+    return None
+
+
+def _root() -> None:
+    """Ralph - Autonomous Claude Code Agent Runner"""
+
+
+def _single_command_app(name: str) -> typer.Typer:
+    """Build an app holding only the named command, so Click converts just that one."""
+    sub = typer.Typer(name=app.info.name, help=app.info.help, add_completion=False)
+    # A root callback keeps group semantics, i.e. `ralph <name> ...` still parses
+    sub.callback()(_root)
+    sub.registered_groups = [g for g in app.registered_groups if g.name == name]
+    sub.registered_commands = [
+        c for c in app.registered_commands
+        if c.callback and (c.name or c.callback.__name__) == name
+    ]
+    return sub
 
 
 def main() -> None:
     """Main entry point."""
-    app()
+    if tuple(sys.argv[1:]) in _VERSION_ARGV:
+        print(f"Ralph v{__version__}")
+        return
+
+    # Only build the parser for the invoked command; bare `ralph`/`--help` get the full app
+    name = _sniff_subcommand(sys.argv)
+    if name:
+        _single_command_app(name)()
+    else:
+        app()
 
 
 if __name__ == "__main__":
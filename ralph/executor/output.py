@@ -96,26 +96,14 @@ class OutputParser:
         # Parse task status
         status_match = cls.TASK_STATUS_PATTERN.search(output)
         if status_match:
-            result.task_status = status_match.group(1).upper()
-            result.task_completed = result.task_status == "COMPLETED"
-
-            # Extract task ID
             id_match = cls.TASK_ID_PATTERN.search(output)
-            if id_match:
-                result.task_id = id_match.group(1)
-
-            # Extract reason if blocked/failed
-            if result.task_status in ("BLOCKED", "FAILED"):
-                reason_match = cls.REASON_PATTERN.search(output)
-                if reason_match:
-                    result.reason = reason_match.group(1).strip()
-
-                if result.task_status == "BLOCKED":
-                    result.blocked_tasks.append(result.task_id or "unknown")
-                else:
-                    result.failed_tasks.append(result.task_id or "unknown")
-            else:
-                result.completed_tasks.append(result.task_id or "unknown")
+            reason_match = cls.REASON_PATTERN.search(output)
+            cls._apply_status(
+                result,
+                status_match.group(1),
+                id_match.group(1) if id_match else None,
+                reason_match.group(1) if reason_match else None,
+            )
 
         # Fallback: check for alternative completion markers
         elif cls.ALT_COMPLETED_PATTERN.search(output):
@@ -134,3 +122,123 @@ class OutputParser:
                 result.errors.append(error_match.group(1).strip())
 
         return result
+
+    @staticmethod
+    def _apply_status(
+        result: ParsedOutput,
+        status: str,
+        task_id: Optional[str],
+        reason: Optional[str],
+    ) -> None:
+        """Fill in a TASK_STATUS marker and its TASK_ID/REASON."""
+        result.task_status = status.upper()
+        result.task_completed = result.task_status == "COMPLETED"
+
+        # Extract task ID
+        if task_id:
+            result.task_id = task_id
+
+        # Extract reason if blocked/failed
+        if result.task_status in ("BLOCKED", "FAILED"):
+            if reason:
+                result.reason = reason.strip()
+
+            if result.task_status == "BLOCKED":
+                result.blocked_tasks.append(result.task_id or "unknown")
+            else:
+                result.failed_tasks.append(result.task_id or "unknown")
+        else:
+            result.completed_tasks.append(result.task_id or "unknown")
+
+
+class StreamingOutputParser:
+    """Finds OutputParser's status markers while output is still streaming.
+
+    Chunks are fed as they arrive and each complete line is scanned once,
+    with a short overlap for markers split across lines, instead of running
+    every pattern over the whole capture after the run. Only the markers
+    are tracked; commits and errors are not collected.
+    """
+
+    # Already-scanned bytes kept in front of new lines
+    OVERLAP = 4096
+    # An unterminated line longer than this is scanned without waiting for it
+    MAX_PENDING = 64 * 1024
+
+    TASK_STATUS_PATTERN = re.compile(
+        rb'TASK_STATUS:\s*(COMPLETED|BLOCKED|FAILED)',
+        re.IGNORECASE
+    )
+    TASK_ID_PATTERN = re.compile(
+        rb'TASK_ID:\s*([A-Za-z0-9_-]+)',
+        re.IGNORECASE
+    )
+    REASON_PATTERN = re.compile(
+        rb'REASON:\s*(.+?)(?:\n|$)',
+        re.IGNORECASE
+    )
+    PROJECT_COMPLETE_PATTERN = re.compile(
+        rb'PROJECT_COMPLETE',
+        re.IGNORECASE
+    )
+    ALT_COMPLETED_PATTERN = re.compile(
+        rb'(?:task|phase).*(?:completed?|done|finished)',
+        re.IGNORECASE
+    )
+
+    def __init__(self):
+        self._pending = b""
+        self._tail = b""
+        self.project_complete = False
+        self.task_status: Optional[str] = None
+        self._task_id: Optional[str] = None
+        self._reason: Optional[str] = None
+        self._alt_completed = False
+
+    def feed(self, data: bytes) -> None:
+        """Scan the complete lines in a chunk of raw output."""
+        data = self._pending + data
+        cut = data.rfind(b"\n") + 1
+        if not cut and len(data) > self.MAX_PENDING:
+            # Keep the end back so a marker straddling the cut is seen whole
+            cut = len(data) - self.OVERLAP
+        self._pending = data[cut:]
+        if cut:
+            self._scan(data[:cut])
+
+    def _scan(self, text: bytes) -> None:
+        window = self._tail + text
+        self._tail = window[-self.OVERLAP:]
+
+        if not self.project_complete and self.PROJECT_COMPLETE_PATTERN.search(window):
+            self.project_complete = True
+        if self.task_status is None:
+            match = self.TASK_STATUS_PATTERN.search(window)
+            if match:
+                self.task_status = match.group(1).decode("ascii").upper()
+        if self._task_id is None:
+            match = self.TASK_ID_PATTERN.search(window)
+            if match:
+                self._task_id = match.group(1).decode("ascii")
+        if self._reason is None:
+            match = self.REASON_PATTERN.search(window)
+            if match:
+                self._reason = match.group(1).decode("utf-8", errors="ignore")
+        if not self._alt_completed and self.ALT_COMPLETED_PATTERN.search(window):
+            self._alt_completed = True
+
+    def result(self, raw_output: str = "") -> ParsedOutput:
+        """Build the ParsedOutput OutputParser.parse() would give for the stream."""
+        if self._pending:
+            self._scan(self._pending)
+            self._pending = b""
+
+        result = ParsedOutput(raw_output=raw_output)
+        if self.project_complete:
+            result.project_complete = True
+        elif self.task_status:
+            OutputParser._apply_status(result, self.task_status, self._task_id, self._reason)
+        elif self._alt_completed:
+            result.task_completed = True
+            result.task_status = "COMPLETED"
+        return result
@@ -0,0 +1,49 @@
+"""Teardown for the Claude child processes."""
+
+import os
+import select
+import signal
+import time
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    import pexpect  # type: ignore[import-untyped]
+
+
+def shutdown_process(
+    process: Optional["pexpect.spawn"], graceful_timeout: float = 1.0
+) -> None:
+    """Stop a child: SIGTERM, up to ``graceful_timeout`` seconds to exit, then kill.
+
+    Returns at once if the child has already exited. The pty is drained
+    while waiting, so a child blocked writing output can still shut down.
+    Exit is polled via isalive() so pexpect keeps ownership of reaping.
+    """
+    if process is None:
+        return
+
+    try:
+        if not process.isalive():
+            return
+        os.kill(process.pid, signal.SIGTERM)
+    except OSError:
+        # Already gone; isalive() below reaps it
+        pass
+
+    fd = process.child_fd
+    deadline = time.monotonic() + graceful_timeout
+
+    while process.isalive():
+        if time.monotonic() >= deadline:
+            try:
+                process.terminate(force=True)
+            except OSError:
+                pass
+            return
+        try:
+            ready, _, _ = select.select([fd], [], [], 0.01)
+            if ready:
+                os.read(fd, 65536)
+        except OSError:
+            # pty already closed (EIO); just wait for the exit status
+            time.sleep(0.01)
@@ -1,6 +1,7 @@
 """Optimized prompt builder for Claude execution."""
 
 from dataclasses import dataclass
+from string import Formatter
 from typing import Optional
 
 from ..state.models import Project, Task, TaskStatus
@@ -17,6 +18,8 @@ class ExecutionContext:
     custom_instructions: str = ""
     commit_prefix: str = "feat:"
     update_source: bool = True
+    # Task to prompt for, if the caller already looked it up
+    next_task: Optional[Task] = None
 
 
 class PromptBuilder:
@@ -79,6 +82,14 @@ Now implement the task carefully. Be thorough but efficient.'''
 
     def __init__(self, context: Optional[ExecutionContext] = None):
         self.context = context
+        # Rendered task sections by task id. Task definitions are fixed once the
+        # project is parsed, and a task that did not finish is offered again on
+        # the next iteration, so the section is reused across the run.
+        self._task_sections: dict[str, str] = {}
+        # Template with the run-constant fields already substituted, and the
+        # context values it was rendered from
+        self._static_key: Optional[tuple] = None
+        self._static_parts: list[tuple[str, Optional[str]]] = []
 
     def build(self, context: Optional[ExecutionContext] = None) -> str:
         """Build the full prompt for Claude execution."""
@@ -87,43 +98,90 @@ Now implement the task carefully. Be thorough but efficient.'''
             raise ValueError("ExecutionContext is required")
 
         # Get next task
-        next_task = ctx.project.get_next_task()
+        next_task = ctx.next_task or ctx.project.get_next_task()
         if not next_task:
             # All tasks complete
             return self._build_completion_check_prompt(ctx)
 
-        # Build progress summary
-        progress_summary = self._format_progress(ctx.project)
-
-        # Build current task section
-        current_task = self._format_task(next_task, ctx.project)
-
-        # Build source files section
-        source_files = self._format_source_files(ctx.source_files)
+        return self.build_dynamic(self.build_static(ctx), ctx, next_task)
+
+    def build_static(self, ctx: ExecutionContext) -> list[tuple[str, Optional[str]]]:
+        """Render the parts of the template that stay fixed for a run.
+
+        Returns (literal, field) pairs: literal text with the static fields
+        filled in, each followed by the name of a per-iteration field (None
+        after the last literal). The result is cached until the static
+        context values change.
+        """
+        key = (
+            ctx.progress_file,
+            tuple(ctx.source_files),
+            ctx.custom_instructions,
+            ctx.commit_prefix,
+        )
+        if key == self._static_key:
+            return self._static_parts
 
         # Custom instructions section
         custom_section = ""
         if ctx.custom_instructions:
             custom_section = f"\n## ADDITIONAL CONTEXT\n{ctx.custom_instructions}\n"
 
-        return self.AUTONOMOUS_PROMPT_TEMPLATE.format(
-            iteration=ctx.iteration,
-            progress_summary=progress_summary,
-            progress_file=ctx.progress_file,
-            current_task=current_task,
-            source_files=source_files,
-            commit_prefix=ctx.commit_prefix,
-            task_id=next_task.id,
-            task_name=next_task.name,
-            custom_section=custom_section,
+        static = {
+            "progress_file": ctx.progress_file,
+            "source_files": self._format_source_files(ctx.source_files),
+            "commit_prefix": ctx.commit_prefix,
+            "custom_section": custom_section,
+        }
+
+        parts: list[tuple[str, Optional[str]]] = []
+        literal: list[str] = []
+        for text, field, _, _ in Formatter().parse(self.AUTONOMOUS_PROMPT_TEMPLATE):
+            literal.append(text)
+            if field is None:
+                continue
+            if field in static:
+                literal.append(static[field])
+            else:
+                parts.append(("".join(literal), field))
+                literal = []
+        parts.append(("".join(literal), None))
+
+        self._static_key = key
+        self._static_parts = parts
+        return parts
+
+    def build_dynamic(
+        self,
+        parts: list[tuple[str, Optional[str]]],
+        ctx: ExecutionContext,
+        next_task: Task,
+    ) -> str:
+        """Fill the per-iteration fields into a template from build_static()."""
+        # Build current task section
+        current_task = self._task_sections.get(next_task.id)
+        if current_task is None:
+            current_task = self._format_task(next_task, ctx.project)
+            self._task_sections[next_task.id] = current_task
+
+        values = {
+            "iteration": str(ctx.iteration),
+            "progress_summary": self._format_progress(ctx.project),
+            "current_task": current_task,
+            "task_id": next_task.id,
+            "task_name": next_task.name,
+        }
+        return "".join(
+            literal + values[field] if field else literal for literal, field in parts
         )
 
     def _format_progress(self, project: Project) -> str:
         """Format project progress summary."""
+        total, completed = project.progress_counts
+        percent = round(completed / total * 100, 1) if total else 0.0
         lines = [
             f"Project: {project.name}",
-            f"Progress: {project.completed_tasks}/{project.total_tasks} tasks "
-            f"({round(project.progress * 100, 1)}%)",
+            f"Progress: {completed}/{total} tasks ({percent}%)",
             "",
             "Phases:",
         ]
@@ -31,10 +31,33 @@ T = TypeVar('T')
 class RetryStrategy:
     """Implements retry logic with exponential backoff."""
 
+    __slots__ = (
+        'config', '_max_attempts', '_base_delay', '_max_delay', '_exp_base',
+        '_jitter', '_jitter_factor', '_attempt', '_last_error', '_delays', '_rand',
+    )
+
     def __init__(self, config: Optional[RetryConfig] = None):
         self.config = config or RetryConfig()
+        # Config is not expected to change after the strategy is built, so
+        # copy its fields once instead of going through self.config per call
+        self._max_attempts = self.config.max_attempts
+        self._base_delay = self.config.base_delay
+        self._max_delay = self.config.max_delay
+        self._exp_base = self.config.exponential_base
+        self._jitter = self.config.jitter
+        self._jitter_factor = self.config.jitter_factor
         self._attempt = 0
         self._last_error: Optional[Exception] = None
+        self._rand = random.random
+        # Capped backoff per attempt, computed once. The table stops at the
+        # first attempt that reaches max_delay, since every later one waits
+        # exactly that long (and raising further can overflow a float).
+        self._delays: list[float] = []
+        for attempt in range(1, self._max_attempts + 1):
+            delay = self._backoff(attempt)
+            self._delays.append(delay)
+            if delay >= self._max_delay:
+                break
 
     @property
     def attempt(self) -> int:
@@ -49,22 +72,30 @@ class RetryStrategy:
     @property
     def should_retry(self) -> bool:
         """Check if more retries are available."""
-        return self._attempt < self.config.max_attempts
+        return self._attempt < self._max_attempts
+
+    def _backoff(self, attempt: int) -> float:
+        """Exponential backoff for an attempt, capped at max delay."""
+        delay = self._base_delay * (self._exp_base ** (attempt - 1))
+        return min(delay, self._max_delay)
 
     def get_delay(self, attempt: Optional[int] = None) -> float:
         """Calculate delay for the given attempt using exponential backoff."""
         attempt = attempt or self._attempt
 
-        # Exponential backoff
-        delay = self.config.base_delay * (self.config.exponential_base ** (attempt - 1))
-
-        # Cap at max delay
-        delay = min(delay, self.config.max_delay)
+        delays = self._delays
+        if 1 <= attempt <= len(delays):
+            delay = delays[attempt - 1]
+        elif attempt > len(delays) and delays and delays[-1] >= self._max_delay:
+            # Past the capped end of the table
+            delay = self._max_delay
+        else:
+            delay = self._backoff(attempt)
 
         # Add jitter
-        if self.config.jitter:
-            jitter_range = delay * self.config.jitter_factor
-            delay += random.uniform(-jitter_range, jitter_range)
+        if self._jitter:
+            jitter_range = delay * self._jitter_factor
+            delay += (self._rand() * 2.0 - 1.0) * jitter_range
 
         return max(0, delay)
 
@@ -96,9 +127,21 @@ class RetryStrategy:
         Returns:
             Tuple of (result_status, return_value, last_exception)
         """
+        if self._max_attempts == 1:
+            # Single attempt: nothing to retry, so skip the loop bookkeeping
+            self._attempt = 1
+            try:
+                self._last_error = None
+                return (RetryResult.SUCCESS, func(), None)
+            except Exception as e:
+                self._last_error = e
+                if should_retry and not should_retry(e):
+                    return (RetryResult.FAILURE, None, e)
+                return (RetryResult.EXHAUSTED, None, e)
+
         self.reset()
 
-        while self._attempt < self.config.max_attempts:
+        while self._attempt < self._max_attempts:
             self._attempt += 1
 
             try:
@@ -112,15 +155,15 @@ class RetryStrategy:
                 if should_retry and not should_retry(e):
                     return (RetryResult.FAILURE, None, e)
 
-                # Check if more attempts available
-                if self._attempt >= self.config.max_attempts:
+                # Out of attempts: return without computing a delay
+                if self._attempt >= self._max_attempts:
                     return (RetryResult.EXHAUSTED, None, e)
 
                 # Call retry callback
                 if on_retry:
                     on_retry(self._attempt, e)
 
-                # Wait before retry
-                self.wait()
+                # A retry follows, so back off (attempt is always >= 1 here)
+                time.sleep(self.get_delay(self._attempt))
 
         return (RetryResult.EXHAUSTED, None, self._last_error)
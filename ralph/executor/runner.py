@@ -1,31 +1,80 @@
 """Simple Claude runner - spawn and let it run."""
 
-import io
-import json
 import os
+import select
 import signal
 import sys
 import threading
 import time
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Optional
-
-import pexpect  # type: ignore[import-untyped]
+from typing import TYPE_CHECKING, Callable, Optional
 
 from ..parser.checkbox import CheckboxUpdater
+from ..state import codec
 from ..state.identity import ProjectIdentity
-from ..state.models import Project
+from ..state.models import Project, Task
 from ..state.store import StateStore
 from ..state.tracker import ProgressTracker
-from .output import OutputParser, ParsedOutput
+from .output import ParsedOutput, StreamingOutputParser
+from .process import shutdown_process
 from .prompt import ExecutionContext, PromptBuilder
 from .retry import RetryConfig
+from .watch import StatusFileWatcher, read_small_file
+
+if TYPE_CHECKING:
+    import pexpect  # type: ignore[import-untyped]
+
+
+def _apply_completed(parsed: ParsedOutput, data: dict) -> None:
+    parsed.task_completed = True
+    parsed.task_status = "COMPLETED"
+    parsed.task_id = data.get("task_id")
+    if parsed.task_id:
+        parsed.completed_tasks.append(parsed.task_id)
+
+
+def _apply_blocked(parsed: ParsedOutput, data: dict) -> None:
+    parsed.task_status = "BLOCKED"
+    parsed.task_id = data.get("task_id")
+    parsed.reason = data.get("reason")
+    if parsed.task_id:
+        parsed.blocked_tasks.append(parsed.task_id)
+
+
+def _apply_failed(parsed: ParsedOutput, data: dict) -> None:
+    parsed.task_status = "FAILED"
+    parsed.task_id = data.get("task_id")
+    parsed.reason = data.get("reason")
+    if parsed.task_id:
+        parsed.failed_tasks.append(parsed.task_id)
+
+
+def _apply_project_complete(parsed: ParsedOutput, data: dict) -> None:
+    parsed.project_complete = True
+
+
+# How each status.json "status" value is recorded on the parsed result
+_STATUS_HANDLERS: dict[str, Callable[[ParsedOutput, dict], None]] = {
+    "COMPLETED": _apply_completed,
+    "BLOCKED": _apply_blocked,
+    "FAILED": _apply_failed,
+    "PROJECT_COMPLETE": _apply_project_complete,
+}
+
+
+# Rule printed around each iteration's banner
+_SEP = "=" * 60
 
 
 class ClaudeRunner:
     """Simple Claude runner - spawns claude and lets it output."""
 
+    # Only the tail of the output is kept; the marker fallback parser looks at
+    # what Claude printed last, and long sessions can emit many megabytes
+    MAX_CAPTURE_BYTES = 1024 * 1024
+
     def __init__(
         self,
         working_dir: str = ".",
@@ -33,17 +82,53 @@ class ClaudeRunner:
         model: Optional[str] = None,
         skip_permissions: bool = True,
         expected_task_id: Optional[str] = None,
+        status_file: Optional[Path] = None,
+        wakeup_fd: Optional[int] = None,
     ):
-        self.working_dir = os.path.abspath(working_dir)
+        # RalphExecutor passes an absolute path; only normalize other callers'
+        self.working_dir = (
+            working_dir if os.path.isabs(working_dir) else os.path.abspath(working_dir)
+        )
         self.idle_timeout = idle_timeout
         self.model = model
         self.skip_permissions = skip_permissions
-        self.expected_task_id = expected_task_id
+        self.expected_task_id: Optional[str] = None
+        self._expected_id_bytes: Optional[bytes] = None
+        self._set_expected_task_id(expected_task_id)
+        # Command-line flags, fixed for the runner's lifetime; run() only
+        # appends the prompt
+        self._base_args: list[str] = []
+        if skip_permissions:
+            self._base_args.append("--dangerously-skip-permissions")
+        if model:
+            self._base_args.extend(["--model", model])
         self.process: Optional[pexpect.spawn] = None
         self._interrupted = False
         self._stop_interaction = False
-        self._captured_output = io.StringIO()
+        # Set once the pty reports EOF, i.e. the child has gone away on its own
+        self._exited = False
+        self._captured_output = bytearray()
+        # Marker fallback, fed as output streams in
+        self._stream_parser = StreamingOutputParser()
         self._last_output_time: Optional[float] = None
+        self._status_cache: Optional[tuple[tuple[int, int, int], dict]] = None
+        # Where Claude reports task status; fixed for the runner's lifetime
+        self._status_file = status_file or Path(self.working_dir, ".ralph", "status.json")
+        self._status_file_str = os.fspath(self._status_file)
+        # Non-blocking read end of a signal wakeup pipe; readable once a
+        # signal arrives, so the read loop notices interrupts right away
+        self._wakeup_fd = wakeup_fd
+
+    def _set_expected_task_id(self, task_id: Optional[str]) -> None:
+        """Set the task whose status file this runner accepts."""
+        self.expected_task_id = task_id
+        # Raw bytes a status file for our task must contain. Only plain ids,
+        # which JSON can never write escaped, are usable as a pre-parse filter.
+        self._expected_id_bytes = None
+        if task_id and task_id.isascii() and (
+            task_id.replace("-", "").replace("_", "").replace(".", "").isalnum()
+        ):
+            self._expected_id_bytes = task_id.encode("ascii")
 
     def _monitor_status_file(self, status_file: Path) -> None:
         """Background thread to monitor status file and signal completion."""
@@ -52,11 +137,16 @@ class ClaudeRunner:
         max_post_status_wait = 30  # Max wait after status detected (fallback)
         idle_threshold = 3  # Exit after 3 seconds of no output
 
-        while not self._stop_interaction:
-            if status_file.exists() and self._is_our_status_file(status_file):
-                if not status_detected:
-                    status_detected = True
-                    post_status_start = time.time()
+        # Sleep on inotify rather than a fixed poll so a written status file
+        # is noticed straight away; the timeout keeps the idle checks ticking
+        watcher = StatusFileWatcher(status_file)
+        try:
+            while not self._stop_interaction:
+                if not status_detected and watcher.changed():
+                    if (os.path.exists(self._status_file_str)
+                            and self._is_our_status_file(status_file)):
+                        status_detected = True
+                        post_status_start = time.time()
 
                 # Check if we should exit based on idle time or max wait
                 if post_status_start:
@@ -84,42 +174,54 @@ class ClaudeRunner:
                             except (OSError, ProcessLookupError):
                                 pass
                         break
-            time.sleep(0.5)  # Check more frequently
+                watcher.wait(0.5)
+        finally:
+            watcher.close()
 
     def _output_filter(self, data: bytes) -> bytes:
         """Filter to capture output while passing it through."""
-        try:
-            text = data.decode('utf-8', errors='ignore')
-            self._captured_output.write(text)
-            # Track last output time for idle detection
-            self._last_output_time = time.time()
-        except Exception:
-            pass
+        captured = self._captured_output
+        captured += data
+        self._stream_parser.feed(data)
+        # Trim lazily so the copy happens once per MAX_CAPTURE_BYTES of output
+        if len(captured) > 2 * self.MAX_CAPTURE_BYTES:
+            del captured[:-self.MAX_CAPTURE_BYTES]
+        # Track last output time for idle detection
+        self._last_output_time = time.time()
         return data
 
-    def run(self, prompt: str) -> tuple[bool, str, ParsedOutput]:
+    def run(
+        self, prompt: str, expected_task_id: Optional[str] = None
+    ) -> tuple[bool, str, ParsedOutput]:
         """
         Run Claude with the given prompt.
         Uses pexpect.interact() for bidirectional I/O, allowing Claude
         to ask questions and receive user input.
+
+        ``expected_task_id``, if given, replaces the task whose status file
+        this and later runs accept, so one runner can serve many tasks.
         """
+        # pexpect (and ptyprocess) cost ~15ms to import; only runs need them
+        import pexpect  # type: ignore[import-untyped]
+
+        if expected_task_id is not None:
+            self._set_expected_task_id(expected_task_id)
         self._interrupted = False
         self._stop_interaction = False
-        self._captured_output = io.StringIO()
+        self._exited = False
+        self._captured_output = bytearray()
+        self._stream_parser = StreamingOutputParser()
         self._last_output_time = None
-        status_file = Path(self.working_dir) / ".ralph" / "status.json"
+        self._status_cache = None
+        status_file = self._status_file
 
         # Clear status file before run
-        if status_file.exists():
-            status_file.unlink()
+        try:
+            os.unlink(self._status_file_str)
+        except FileNotFoundError:
+            pass
 
-        # Build command args
-        args = []
-        if self.skip_permissions:
-            args.append("--dangerously-skip-permissions")
-        if self.model:
-            args.extend(["--model", self.model])
-        args.append(prompt)
+        args = [*self._base_args, prompt]
 
         try:
             # Check if we're in a real terminal (not piped/redirected)
@@ -131,6 +233,7 @@ class ClaudeRunner:
                 args,
                 cwd=self.working_dir,
                 timeout=None if is_interactive else self.idle_timeout,
+                maxread=65536,
                 encoding=None,  # Use bytes for interact()
             )
 
@@ -151,54 +254,88 @@ class ClaudeRunner:
                     # Process may have terminated
                     pass
             else:
-                # Non-interactive mode: fall back to expect loop
-                self.process.logfile_read = sys.stdout.buffer
+                # Non-interactive mode: pump the pty ourselves. expect(r'.+')
+                # re-scans pexpect's growing buffer on every call, which turns
+                # quadratic on long sessions.
+                fd = self.process.child_fd
+                stdout = sys.stdout.buffer
+                # Wake on status file writes instead of stat-ing it per chunk
+                # (falls back to checking on every chunk without inotify)
+                watcher = StatusFileWatcher(status_file)
+                watch_fd = watcher.fileno()
+                wakeup_fd = self._wakeup_fd
+                fds = [f for f in (fd, watch_fd, wakeup_fd) if f is not None]
 
                 status_detected = False
                 post_status_start = None
                 post_status_idle_timeout = 3
                 max_post_status_wait = 10
 
-                while True:
-                    try:
-                        timeout = post_status_idle_timeout if status_detected else self.idle_timeout
-                        self.process.expect(r'.+', timeout=timeout)
+                try:
+                    while True:
+                        # Flush echoed output only when the stream pauses, so a
+                        # burst of small reads costs one write() instead of many
+                        ready, _, _ = select.select(fds, [], [], 0)
+                        if not ready:
+                            stdout.flush()
+                            timeout = (
+                                post_status_idle_timeout if status_detected else self.idle_timeout
+                            )
+                            ready, _, _ = select.select(fds, [], [], timeout)
+                            if not ready:
+                                break  # Idle timeout
+
+                        if wakeup_fd is not None and wakeup_fd in ready:
+                            try:
+                                os.read(wakeup_fd, 512)
+                            except OSError:
+                                pass
+                            if self._interrupted:
+                                break
+
+                        if fd in ready:
+                            try:
+                                chunk = os.read(fd, 65536)
+                            except OSError:
+                                # EIO: child closed the pty
+                                self._exited = True
+                                break
+                            if not chunk:
+                                self._exited = True
+                                break
 
-                        if status_file.exists() and not status_detected:
-                            if self._is_our_status_file(status_file):
-                                status_detected = True
-                                post_status_start = time.time()
+                            stdout.write(chunk)
+                            self._output_filter(chunk)
+
+                        if watch_fd is None or watch_fd in ready:
+                            if watcher.changed() and not status_detected:
+                                if (os.path.exists(self._status_file_str)
+                                        and self._is_our_status_file(status_file)):
+                                    status_detected = True
+                                    post_status_start = time.time()
 
                         if status_detected and post_status_start:
                             if time.time() - post_status_start > max_post_status_wait:
                                 break
-
-                    except pexpect.TIMEOUT:
-                        break
-                    except pexpect.EOF:
-                        break
+                finally:
+                    stdout.flush()
+                    watcher.close()
 
             # Signal monitor thread to stop
             self._stop_interaction = True
             monitor_thread.join(timeout=2)
 
-            # Clean up process
-            if self.process and self.process.isalive():
-                try:
-                    # Send SIGTERM to gracefully terminate Claude CLI
-                    os.kill(self.process.pid, signal.SIGTERM)
-                    self.process.expect(pexpect.EOF, timeout=10)
-                except (pexpect.TIMEOUT, pexpect.EOF, OSError, ProcessLookupError):
-                    self.process.terminate(force=True)
-
-            # Get output for parsing
-            output = self._captured_output.getvalue()
-            if not output and self.process and self.process.before:
-                before = self.process.before
-                if isinstance(before, bytes):
-                    output = before.decode('utf-8', errors='ignore')
-                else:
-                    output = str(before)
+            # Clean up process. After EOF the child is already exiting, so
+            # skip the SIGTERM and let the finally block reap it.
+            if not self._exited:
+                shutdown_process(self.process)
+
+            # Markers were already matched on the raw bytes while streaming;
+            # this is the one decode, for the returned text. Decode once, after
+            # the run, so multi-byte characters split across reads survive, and
+            # straight from the buffer rather than a sliced copy of it.
+            with memoryview(self._captured_output) as view:
+                output = str(view[-self.MAX_CAPTURE_BYTES:], 'utf-8', 'ignore')
 
             # Read status from file (Claude writes here when done)
             parsed = self._read_status_file(status_file, output)
@@ -209,13 +346,8 @@ class ClaudeRunner:
 
         finally:
             self._stop_interaction = True
-            if self.process:
-                try:
-                    if self.process.isalive():
-                        self.process.terminate(force=True)
-                except OSError:
-                    pass
-                self.process = None
+            shutdown_process(self.process, graceful_timeout=0)
+            self.process = None
 
     def _is_our_status_file(self, status_file: Path) -> bool:
         """Check if status file belongs to this process.
@@ -228,55 +360,72 @@ class ClaudeRunner:
             # Legacy mode: accept any status file
             return True
 
+        data = self._load_status(status_file, must_contain=self._expected_id_bytes)
+        if data is None:
+            # Missing, partially written or another task's; ignore for now
+            return False
+
+        # Check if task_id matches (works for COMPLETED, BLOCKED, FAILED, PROJECT_COMPLETE)
+        return bool(data.get("task_id") == self.expected_task_id)
+
+    def _load_status(
+        self, status_file: Path, must_contain: Optional[bytes] = None
+    ) -> Optional[dict]:
+        """Parse the status file, reusing the last parse while it is unchanged.
+
+        The monitor thread, the read loop and the final read all look at the
+        same file; keyed on (ino, mtime_ns, size), each write is parsed once
+        (the inode catches a same-sized file renamed into place).
+        Returns None if the file is missing, partially written, not an object,
+        or (when ``must_contain`` is given) lacks those bytes. The last check
+        skips the JSON parse for files that cannot be the caller's.
+        """
         try:
-            data = json.loads(status_file.read_text())
-            file_task_id = data.get("task_id")
+            st = os.stat(status_file)
+        except OSError:
+            return None
 
-            # Check if task_id matches (works for COMPLETED, BLOCKED, FAILED, PROJECT_COMPLETE)
-            return bool(file_task_id == self.expected_task_id)
-        except (OSError, json.JSONDecodeError):
-            # File might be partially written, ignore for now
-            return False
+        key = (st.st_ino, st.st_mtime_ns, st.st_size)
+        cached = self._status_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        raw = read_small_file(status_file, st.st_size)
+        if raw is None:
+            return None
+
+        # An object still being written has no closing brace yet
+        if not raw.rstrip().endswith(b'}'):
+            return None
+        if must_contain is not None and must_contain not in raw:
+            return None
+
+        try:
+            data = codec.loads(raw)
+        except ValueError:
+            return None
+        if not isinstance(data, dict) or not data.get("status"):
+            return None
+
+        self._status_cache = (key, data)
+        return data
 
     def _read_status_file(self, status_file: Path, output: str) -> ParsedOutput:
         """Read status from file written by Claude."""
         parsed = ParsedOutput(raw_output=output)
 
-        if status_file.exists():
-            try:
-                data = json.loads(status_file.read_text())
-                status = data.get("status", "").upper()
-
-                if status == "COMPLETED":
-                    parsed.task_completed = True
-                    parsed.task_status = "COMPLETED"
-                    parsed.task_id = data.get("task_id")
-                    if parsed.task_id:
-                        parsed.completed_tasks.append(parsed.task_id)
-
-                elif status == "BLOCKED":
-                    parsed.task_status = "BLOCKED"
-                    parsed.task_id = data.get("task_id")
-                    parsed.reason = data.get("reason")
-                    if parsed.task_id:
-                        parsed.blocked_tasks.append(parsed.task_id)
-
-                elif status == "FAILED":
-                    parsed.task_status = "FAILED"
-                    parsed.task_id = data.get("task_id")
-                    parsed.reason = data.get("reason")
-                    if parsed.task_id:
-                        parsed.failed_tasks.append(parsed.task_id)
-
-                elif status == "PROJECT_COMPLETE":
-                    parsed.project_complete = True
-
-            except (OSError, json.JSONDecodeError):
-                pass
+        parsed_via_json = False
+        data = self._load_status(status_file)
+        if data is not None:
+            handler = _STATUS_HANDLERS.get(data.get("status", "").upper())
+            if handler:
+                handler(parsed, data)
+                parsed_via_json = True
 
-        # Fallback: also check output for markers
-        if not parsed.task_completed and not parsed.project_complete:
-            parsed = OutputParser.parse(output)
+        # Fallback: use the markers seen in the output only when the status
+        # file said nothing usable; a BLOCKED/FAILED status is authoritative too
+        if not parsed_via_json:
+            parsed = self._stream_parser.result(raw_output=output)
 
         return parsed
 
@@ -324,6 +473,8 @@ class RalphExecutor:
         self.on_progress = on_progress
         self.retry_config = retry_config or RetryConfig()
         self.project_identity = project_identity
+        # Status file path handed to each iteration's runner
+        self._status_file = Path(self.working_dir, ".ralph", "status.json")
 
         # State management - use project-specific directory if identity provided
         self.store = StateStore(working_dir, project_identity=project_identity)
@@ -331,7 +482,11 @@ class RalphExecutor:
         self.prompt_builder = PromptBuilder()
 
         # Execution state
-        self._interrupted = False
+        # Set on interrupt; waiting on it lets the pause between iterations
+        # end immediately
+        self._interrupt_event = threading.Event()
+        # Signal wakeup pipe (read end, write end, previous wakeup fd)
+        self._wakeup: Optional[tuple[int, int, int]] = None
         self._current_runner: Optional[ClaudeRunner] = None
         self.start_time: Optional[datetime] = None
 
@@ -349,21 +504,43 @@ class RalphExecutor:
     def run(self) -> bool:
         """Run the execution loop."""
         self._setup_signal_handlers()
+        try:
+            return self._run_iterations()
+        finally:
+            self._close_wakeup_fd()
+
+    def _run_iterations(self) -> bool:
+        """Set up state and run iterations until done, stopped or out of budget."""
         self.setup()
         self.start_time = datetime.now()
 
+        # One runner serves every iteration; its state is reset per run
+        runner = self._current_runner = ClaudeRunner(
+            working_dir=self.working_dir,
+            idle_timeout=self.idle_timeout,
+            model=self.model,
+            skip_permissions=self.skip_permissions,
+            status_file=self._status_file,
+            wakeup_fd=self._wakeup[0] if self._wakeup else None,
+        )
+
         # Continue from last iteration + 1
         start_iteration = self.project.current_iteration + 1
         end_iteration = start_iteration + self.max_iterations
 
+        # Looked up again only when task states may have changed; the end of
+        # each iteration finds the next task for the one that follows
+        next_task: Optional[Task] = None
+
         for iteration in range(start_iteration, end_iteration):
-            if self._interrupted:
+            if self._interrupt_event.is_set():
                 break
 
             if self.project.is_complete:
                 return True
 
-            next_task = self.project.get_next_task()
+            if next_task is None:
+                next_task = self.project.get_next_task()
             if not next_task:
                 self.project.update_status()
                 if self.project.is_complete:
@@ -382,22 +559,18 @@ class RalphExecutor:
                 custom_instructions=self.custom_instructions,
                 commit_prefix=self.commit_prefix,
                 update_source=self.update_source,
+                next_task=next_task,
             )
             prompt = self.prompt_builder.build(context)
 
             # Run Claude
-            print(f"\n{'='*60}")
-            print(f"  Iteration {iteration} (max additional: {self.max_iterations})")
-            print(f"{'='*60}\n")
-
-            self._current_runner = ClaudeRunner(
-                working_dir=self.working_dir,
-                idle_timeout=self.idle_timeout,
-                model=self.model,
-                skip_permissions=self.skip_permissions,
-                expected_task_id=next_task.id,
+            print(
+                f"\n{_SEP}\n"
+                f"  Iteration {iteration} (max additional: {self.max_iterations})\n"
+                f"{_SEP}\n"
             )
-            success, output, parsed = self._current_runner.run(prompt)
+
+            success, output, parsed = runner.run(prompt, expected_task_id=next_task.id)
 
             # Process results
             self._process_iteration_result(iteration, parsed)
@@ -405,7 +578,7 @@ class RalphExecutor:
             status = "success" if parsed.is_success else "failed"
             self.tracker.end_iteration(status=status)
 
-            if self._interrupted:
+            if self._interrupt_event.is_set():
                 break
 
             # Decision based on status file
@@ -432,46 +605,78 @@ class RalphExecutor:
             # More tasks - continue
             print(f"\n  ✓ Task done. Next: {next_task.name}")
             if iteration < self.max_iterations:
-                import time
-                time.sleep(self.sleep_between)
+                if self._interrupt_event.wait(self.sleep_between):
+                    break
 
         return self.project.is_complete
 
     def _process_iteration_result(self, iteration: int, parsed: ParsedOutput) -> None:
         """Process iteration results."""
+        # One index for the whole pass instead of a project scan per reported id
+        tasks_by_id = {t.id: t for phase in self.project.phases for t in phase.tasks}
+
+        # Checkbox lines to tick, grouped so each source file is rewritten once
+        checkbox_edits: dict[str, list[int]] = defaultdict(list)
+
         for task_id in parsed.completed_tasks:
-            task = self.project.get_task_by_id(task_id)
+            task = tasks_by_id.get(task_id)
             if task:
                 self.tracker.complete_task(task_id)
                 if self.update_source and task.source_file and task.source_line:
-                    CheckboxUpdater.update_file_by_line(
-                        task.source_file,
-                        task.source_line,
-                        completed=True
-                    )
+                    checkbox_edits[task.source_file].append(task.source_line)
+
+        for source_file, line_numbers in checkbox_edits.items():
+            CheckboxUpdater.update_file_by_lines(source_file, line_numbers, completed=True)
 
         for task_id in parsed.failed_tasks:
             self.tracker.fail_task(task_id, parsed.reason or "Unknown error")
 
         for task_id in parsed.blocked_tasks:
-            task = self.project.get_task_by_id(task_id)
+            task = tasks_by_id.get(task_id)
             if task:
                 task.mark_blocked(parsed.reason or "Unknown blocker")
+                self.store.mark_dirty()
 
+        # Completed and failed tasks were saved by the tracker; only write
+        # again if something changed in place since
         self.project.update_status()
-        self.store.save()
+        self.store.save_if_dirty()
 
     def _setup_signal_handlers(self) -> None:
         """Set up signal handlers."""
         def handler(_signum, _frame):
-            self._interrupted = True
+            self._interrupt_event.set()
             if self._current_runner:
                 self._current_runner.interrupt()
         signal.signal(signal.SIGINT, handler)
         signal.signal(signal.SIGTERM, handler)
 
+        # Have signals also write to a pipe the runner selects on, so its
+        # read loop wakes as soon as one arrives
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(read_fd, False)
+        os.set_blocking(write_fd, False)
+        try:
+            previous = signal.set_wakeup_fd(write_fd, warn_on_full_buffer=False)
+        except ValueError:
+            # Not the main thread; the runner falls back to its timeouts
+            os.close(read_fd)
+            os.close(write_fd)
+            return
+        self._wakeup = (read_fd, write_fd, previous)
+
+    def _close_wakeup_fd(self) -> None:
+        """Restore the previous signal wakeup fd and close the pipe."""
+        if self._wakeup is None:
+            return
+        read_fd, write_fd, previous = self._wakeup
+        self._wakeup = None
+        signal.set_wakeup_fd(previous)
+        os.close(read_fd)
+        os.close(write_fd)
+
     def interrupt(self) -> None:
         """Interrupt execution."""
-        self._interrupted = True
+        self._interrupt_event.set()
         if self._current_runner:
             self._current_runner.interrupt()
@@ -0,0 +1,117 @@
+"""Change notification and reads for the status file Claude writes."""
+
+import ctypes
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+# inotify(7) constants
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = 0o2000000
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class StatusFileWatcher:
+    """Reports when a file is written or renamed into place.
+
+    Uses inotify on Linux so callers can select() on ``fileno()`` instead of
+    stat-ing the file on every wakeup. Elsewhere, or if inotify is
+    unavailable, ``fileno()`` returns None and callers keep polling.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._name = os.fsencode(path.name)
+        self._fd: Optional[int] = None
+        # The file may have been written before the watch was set up
+        self._first = True
+
+        if not sys.platform.startswith("linux"):
+            return
+
+        try:
+            libc = ctypes.CDLL(None, use_errno=True)
+            fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        except (OSError, AttributeError):
+            return
+        if fd < 0:
+            return
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        wd = libc.inotify_add_watch(
+            fd, os.fsencode(path.parent), _IN_CLOSE_WRITE | _IN_MOVED_TO
+        )
+        if wd < 0:
+            os.close(fd)
+            return
+        self._fd = fd
+
+    def fileno(self) -> Optional[int]:
+        """Descriptor that becomes readable on changes, or None when polling."""
+        return self._fd
+
+    def wait(self, timeout: float) -> None:
+        """Block until the watched directory reports a change or timeout passes."""
+        if self._fd is None:
+            time.sleep(timeout)
+            return
+        select.select([self._fd], [], [], timeout)
+
+    def changed(self) -> bool:
+        """Consume pending events; True if any of them touched the file.
+
+        Without inotify this always returns True, so a poll-based caller
+        checks the file on every call as before. The first call also returns
+        True, covering writes that landed before the watch existed.
+        """
+        if self._fd is None:
+            return True
+
+        hit = self._first
+        self._first = False
+        while True:
+            try:
+                data = os.read(self._fd, 4096)
+            except BlockingIOError:
+                return hit
+            if not data:
+                return hit
+
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(data):
+                _, _, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b"\0")
+                offset += length
+                if name == self._name:
+                    hit = True
+
+    def close(self) -> None:
+        """Release the inotify descriptor."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+def read_small_file(path: Path, size: int) -> Optional[bytes]:
+    """Read a small file with one open/read/close, or None if it is gone.
+
+    Skips the buffered file object (and the extra fstat calls it makes);
+    reads a little past ``size`` in case the file grew since it was stat'ed.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_CLOEXEC", 0))
+    except OSError:
+        return None
+    try:
+        return os.read(fd, size + 4096)
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
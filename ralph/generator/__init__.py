@@ -1,10 +1,22 @@
 """Generator package for PRD and phased plans generation."""
 
 from .base import Generator, GeneratorContext, GeneratorResult
-from .plans import PlansGenerator
-from .prd import PRDGenerator
 from .prompt_loader import PromptLoader
 
+
+# Lazy imports for the generators, which pull in the Claude executor
+def __getattr__(name: str):
+    if name == "PRDGenerator":
+        from .prd import PRDGenerator
+
+        return PRDGenerator
+    if name == "PlansGenerator":
+        from .plans import PlansGenerator
+
+        return PlansGenerator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "Generator",
     "GeneratorContext",
@@ -1,16 +1,21 @@
 """Execute Claude for generation tasks."""
 
-import io
-import json
 import os
+import select
+import signal
 import sys
 import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-import pexpect  # type: ignore[import-untyped]
+from ..executor.process import shutdown_process
+from ..executor.watch import StatusFileWatcher, read_small_file
+from ..state import codec
+
+if TYPE_CHECKING:
+    import pexpect  # type: ignore[import-untyped]
 
 
 @dataclass
@@ -24,22 +29,29 @@ class GenerationExecutionConfig:
 
 
 class TeeWriter:
-    """Writes to both stdout and captures output."""
+    """Writes to both stdout and captures output.
 
-    def __init__(self):
-        self.captured = io.StringIO()
+    pexpect hands over raw bytes, so they go straight to the binary stdout
+    and are decoded once, in getvalue().
+    """
 
-    def write(self, data: str) -> int:
-        sys.stdout.write(data)
-        sys.stdout.flush()
-        self.captured.write(data)
+    def __init__(self):
+        self.chunks: list[bytes] = []
+        self._stdout = sys.stdout.buffer
+
+    def write(self, data: bytes) -> int:
+        self._stdout.write(data)
+        self.chunks.append(data)
+        # Flush per line rather than per chunk
+        if data.endswith(b"\n"):
+            self._stdout.flush()
         return len(data)
 
     def flush(self) -> None:
-        sys.stdout.flush()
+        self._stdout.flush()
 
     def getvalue(self) -> str:
-        return str(self.captured.getvalue())
+        return b"".join(self.chunks).decode("utf-8", errors="ignore")
 
 
 class GeneratorExecutor:
@@ -49,8 +61,40 @@ class GeneratorExecutor:
         self.config = config or GenerationExecutionConfig()
         self.process: Optional[pexpect.spawn] = None
         self._stop_interaction = False
-        self._captured_output = io.StringIO()
+        self._captured_chunks: list[bytes] = []
         self._last_output_time: Optional[float] = None
+        self._status_cache: Optional[tuple[tuple[int, int, int], dict]] = None
+
+    def _load_status(self, status_file: Path) -> Optional[dict]:
+        """Parse the status file, reusing the last parse while it is unchanged.
+
+        Keyed on (ino, mtime_ns, size) so the monitor thread and the expect
+        loop parse each write once. Returns None if the file is missing,
+        partially written or has no status yet.
+        """
+        try:
+            st = os.stat(status_file)
+        except OSError:
+            return None
+
+        key = (st.st_ino, st.st_mtime_ns, st.st_size)
+        cached = self._status_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        raw = read_small_file(status_file, st.st_size)
+        if raw is None:
+            return None
+        try:
+            data = codec.loads(raw)
+        except ValueError:
+            # File might be partially written, ignore for now
+            return None
+        if not isinstance(data, dict) or not data.get("status"):
+            return None
+
+        self._status_cache = (key, data)
+        return data
 
     def _is_our_status_file(self, status_file: Path) -> bool:
         """Check if status file belongs to this process.
@@ -62,20 +106,16 @@ class GeneratorExecutor:
             # Legacy mode: accept any status file
             return True
 
-        try:
-            data = json.loads(status_file.read_text())
-            file_task_id = data.get("task_id")
-            status = data.get("status", "").upper()
-
-            # COMPLETED status with matching task_id
-            if status == "COMPLETED" and file_task_id == self.config.expected_task_id:
-                return True
-
-            return False
-        except (OSError, json.JSONDecodeError):
-            # File might be partially written, ignore for now
+        data = self._load_status(status_file)
+        if data is None:
             return False
 
+        # COMPLETED status with matching task_id
+        return (
+            data["status"].upper() == "COMPLETED"
+            and data.get("task_id") == self.config.expected_task_id
+        )
+
     def _monitor_status_file(self, status_file: Path) -> None:
         """Background thread to monitor status file and signal completion."""
         status_detected = False
@@ -83,11 +123,15 @@ class GeneratorExecutor:
         max_post_status_wait = 30  # Max wait after status detected (fallback)
         idle_threshold = 3  # Exit after 3 seconds of no output
 
-        while not self._stop_interaction:
-            if status_file.exists() and self._is_our_status_file(status_file):
-                if not status_detected:
-                    status_detected = True
-                    post_status_start = time.time()
+        # Sleep on inotify rather than a fixed poll so a written status file
+        # is noticed straight away; the timeout keeps the idle checks ticking
+        watcher = StatusFileWatcher(status_file)
+        try:
+            while not self._stop_interaction:
+                if not status_detected and watcher.changed():
+                    if status_file.exists() and self._is_our_status_file(status_file):
+                        status_detected = True
+                        post_status_start = time.time()
 
                 # Check if we should exit based on idle time or max wait
                 if post_status_start:
@@ -101,8 +145,7 @@ class GeneratorExecutor:
                             if self.process and self.process.isalive():
                                 try:
                                     # Send SIGTERM to gracefully terminate Claude CLI
-                                    import signal as _signal
-                                    os.kill(self.process.pid, _signal.SIGTERM)
+                                    os.kill(self.process.pid, signal.SIGTERM)
                                 except (OSError, ProcessLookupError):
                                     pass
                             break
@@ -112,22 +155,23 @@ class GeneratorExecutor:
                         self._stop_interaction = True
                         if self.process and self.process.isalive():
                             try:
-                                import signal as _signal
-                                os.kill(self.process.pid, _signal.SIGTERM)
+                                os.kill(self.process.pid, signal.SIGTERM)
                             except (OSError, ProcessLookupError):
                                 pass
                         break
-            time.sleep(0.5)  # Check more frequently
+                watcher.wait(0.5)
+        finally:
+            watcher.close()
 
     def _output_filter(self, data: bytes) -> bytes:
-        """Filter to capture output while passing it through."""
-        try:
-            text = data.decode('utf-8', errors='ignore')
-            self._captured_output.write(text)
-            # Track last output time for idle detection
-            self._last_output_time = time.time()
-        except Exception:
-            pass
+        """Filter to capture output while passing it through.
+
+        Raw bytes are kept and decoded once at the end, so a multi-byte
+        character split across two reads is not lost.
+        """
+        self._captured_chunks.append(data)
+        # Track last output time for idle detection
+        self._last_output_time = time.time()
         return data
 
     def execute(self, prompt: str) -> tuple[bool, str]:
@@ -136,6 +180,10 @@ class GeneratorExecutor:
         Uses pexpect.interact() to allow bidirectional I/O, enabling
         Claude to ask questions and receive user input.
         """
+        # Only generation runs need pexpect (and ptyprocess); keep it off the
+        # import path of the rest of the CLI
+        import pexpect  # type: ignore[import-untyped]
+
         args = []
 
         if self.config.skip_permissions:
@@ -154,8 +202,9 @@ class GeneratorExecutor:
             status_file.unlink()
 
         self._stop_interaction = False
-        self._captured_output = io.StringIO()
+        self._captured_chunks = []
         self._last_output_time = None
+        self._status_cache = None
 
         try:
             # Check if we're in a real terminal (not piped/redirected)
@@ -186,53 +235,61 @@ class GeneratorExecutor:
                 except OSError:
                     # Process may have terminated
                     pass
+                output = b"".join(self._captured_chunks).decode("utf-8", errors="ignore")
             else:
-                # Non-interactive mode: fall back to expect loop
+                # Non-interactive mode: pump the pty directly. expect() runs
+                # a regex over pexpect's buffer on every chunk.
                 tee = TeeWriter()
-                self.process.logfile_read = tee
-
-                while True:
-                    try:
-                        self.process.expect(r'.+', timeout=self.config.idle_timeout)
-
-                        if status_file.exists() and self._is_our_status_file(status_file):
-                            break
+                fd = self.process.child_fd
+                # Only look at the status file after it has been written,
+                # not after every chunk of output
+                watcher = StatusFileWatcher(status_file)
+                watch_fd = watcher.fileno()
+                fds = [fd] if watch_fd is None else [fd, watch_fd]
 
-                    except pexpect.TIMEOUT:
-                        break
-                    except pexpect.EOF:
-                        break
+                try:
+                    while True:
+                        ready, _, _ = select.select(fds, [], [], self.config.idle_timeout)
+                        if not ready:
+                            break  # Idle timeout
 
-                self._captured_output.write(tee.getvalue())
+                        if fd in ready:
+                            try:
+                                chunk = os.read(fd, 65536)
+                            except OSError:
+                                break  # EIO: child closed the pty
+                            if not chunk:
+                                break
+                            tee.write(chunk)
+
+                        if watch_fd is None or watch_fd in ready:
+                            if (watcher.changed() and status_file.exists()
+                                    and self._is_our_status_file(status_file)):
+                                break
+                finally:
+                    tee.flush()
+                    watcher.close()
+
+                # Hand the tee's buffer back directly rather than copying it
+                # through _captured_chunks and out again
+                output = tee.getvalue()
 
             # Signal monitor thread to stop
             self._stop_interaction = True
             monitor_thread.join(timeout=2)
 
             # Clean up process
-            if self.process and self.process.isalive():
-                try:
-                    # Send SIGTERM to gracefully terminate Claude CLI
-                    import signal as _signal
-                    os.kill(self.process.pid, _signal.SIGTERM)
-                    self.process.expect(pexpect.EOF, timeout=10)
-                except (pexpect.TIMEOUT, pexpect.EOF, OSError, ProcessLookupError):
-                    self.process.terminate(force=True)
+            shutdown_process(self.process)
 
-            return (True, self._captured_output.getvalue())
+            return (True, output)
 
         except Exception as e:
             return (False, f"Execution failed: {e}")
 
         finally:
             self._stop_interaction = True
-            if self.process:
-                try:
-                    if self.process.isalive():
-                        self.process.terminate(force=True)
-                except OSError:
-                    pass
-                self.process = None
+            shutdown_process(self.process, graceful_timeout=0)
+            self.process = None
 
     def interrupt(self) -> None:
         """Interrupt the current execution."""
@@ -1,5 +1,6 @@
 """Phased implementation plans generator."""
 
+from dataclasses import replace
 from pathlib import Path
 from typing import Optional
 
@@ -39,13 +40,7 @@ class PlansGenerator(Generator):
         user_prompt = self.prompt_loader.load(context.prompt)
 
         # Build context
-        gen_context = GeneratorContext(
-            prompt=user_prompt,
-            output_path=context.output_path,
-            project_name=context.project_name,
-            num_phases=context.num_phases,
-            max_tasks_per_phase=context.max_tasks_per_phase,
-        )
+        gen_context = replace(context, prompt=user_prompt)
 
         # Build generation prompt
         prompt = self.prompt_builder.build_plans_prompt(gen_context)
@@ -98,11 +93,5 @@ class PlansGenerator(Generator):
     def dry_run(self, context: GeneratorContext) -> str:
         """Return the prompt that would be sent to Claude."""
         user_prompt = self.prompt_loader.load(context.prompt)
-        gen_context = GeneratorContext(
-            prompt=user_prompt,
-            output_path=context.output_path,
-            project_name=context.project_name,
-            num_phases=context.num_phases,
-            max_tasks_per_phase=context.max_tasks_per_phase,
-        )
+        gen_context = replace(context, prompt=user_prompt)
         return self.prompt_builder.build_plans_prompt(gen_context)
@@ -1,5 +1,6 @@
 """PRD (Product Requirements Document) generator."""
 
+from dataclasses import replace
 from typing import Optional
 
 from .base import Generator, GeneratorContext, GeneratorResult
@@ -38,11 +39,7 @@ class PRDGenerator(Generator):
         user_prompt = self.prompt_loader.load(context.prompt)
 
         # Build context with user prompt
-        gen_context = GeneratorContext(
-            prompt=user_prompt,
-            output_path=context.output_path,
-            project_name=context.project_name,
-        )
+        gen_context = replace(context, prompt=user_prompt)
 
         # Build generation prompt
         prompt = self.prompt_builder.build_prd_prompt(gen_context)
@@ -63,9 +60,5 @@ class PRDGenerator(Generator):
     def dry_run(self, context: GeneratorContext) -> str:
         """Return the prompt that would be sent to Claude."""
         user_prompt = self.prompt_loader.load(context.prompt)
-        gen_context = GeneratorContext(
-            prompt=user_prompt,
-            output_path=context.output_path,
-            project_name=context.project_name,
-        )
+        gen_context = replace(context, prompt=user_prompt)
         return self.prompt_builder.build_prd_prompt(gen_context)
@@ -10,6 +10,8 @@ class PromptLoader:
 
     def __init__(self):
         self._cache: dict[str, str] = {}
+        # Resolved result per load() source, so repeat loads skip the stats
+        self._sources: dict[str, str] = {}
 
     def load(self, source: str) -> str:
         """
@@ -21,10 +23,15 @@ class PromptLoader:
         Returns:
             Prompt content as string
         """
-        # Check if it's a file path
+        if source in self._sources:
+            return self._sources[source]
+
+        # Check if it's a file path (is_file() is False for missing paths)
         path = Path(source)
-        if path.exists() and path.is_file():
-            return self.load_file(str(path))
+        if path.is_file():
+            content = self.load_file(str(path))
+            self._sources[source] = content
+            return content
 
         # Return as direct prompt
         return source
@@ -92,11 +99,10 @@ class PromptLoader:
                     errors.append(f"Failed to read file: {e}")
             elif path.is_dir():
                 # Check if directory has any prompt files
-                has_prompts = False
-                for ext in self.SUPPORTED_EXTENSIONS:
-                    if list(path.glob(f"*{ext}")):
-                        has_prompts = True
-                        break
+                has_prompts = any(
+                    next(path.glob(f"*{ext}"), None) is not None
+                    for ext in self.SUPPORTED_EXTENSIONS
+                )
                 if not has_prompts:
                     errors.append(f"No prompt files found in directory: {source}")
         else:
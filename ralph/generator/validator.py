@@ -50,6 +50,30 @@ class GeneratorValidator:
         r'^##\s+(?:Phase\s+\d+[:\s]*)?(.+?)$',
         re.MULTILINE
     )
+    PRD_TITLE_PATTERN = re.compile(r'^#\s+PRD:', re.MULTILINE)
+    PRD_SECTION_PATTERNS = {
+        section: re.compile(rf'^##\s+{section}', re.MULTILINE)
+        for section in ("Overview", "User Stories")
+    }
+    PRD_STORY_SPLIT_PATTERN = re.compile(r'(?=^###\s+[A-Z]+-\d+)', re.MULTILINE)
+    PRD_STORY_HEADER_PATTERN = re.compile(r'^###\s+([A-Z]+-\d+)')
+    OBJECTIVE_SECTION_PATTERN = re.compile(
+        r'^##\s+Objective',
+        re.MULTILINE | re.IGNORECASE
+    )
+    PHASED_APPROACH_SECTION_PATTERN = re.compile(
+        r'^##\s+Phased\s+Approach',
+        re.MULTILINE | re.IGNORECASE
+    )
+    TASKS_SECTION_PATTERN = re.compile(
+        r'^##\s+Tasks',
+        re.MULTILINE | re.IGNORECASE
+    )
+    PHASE_HEADER_PATTERN = re.compile(r'^#\s+Phase\s+\d+', re.MULTILINE)
+    DEPENDENCY_PATTERN = re.compile(
+        r'^\s*-?\s*Dependenc(?:y|ies):\s*(.+?)$',
+        re.MULTILINE | re.IGNORECASE
+    )
 
     def __init__(self):
         self.parser = MarkdownParser()
@@ -67,13 +91,12 @@ class GeneratorValidator:
         result = ValidationResult(valid=True)
 
         # Check for project title
-        if not re.search(r'^#\s+PRD:', content, re.MULTILINE):
+        if not self.PRD_TITLE_PATTERN.search(content):
             result.warnings.append("Missing 'PRD:' prefix in title")
 
         # Check for required sections
-        required_sections = ["Overview", "User Stories"]
-        for section in required_sections:
-            if not re.search(rf'^##\s+{section}', content, re.MULTILINE):
+        for section, pattern in self.PRD_SECTION_PATTERNS.items():
+            if not pattern.search(content):
                 result.errors.append(f"Missing required section: {section}")
                 result.valid = False
 
@@ -92,13 +115,13 @@ class GeneratorValidator:
                 result.valid = False
 
         # Validate each user story has required fields
-        story_blocks = re.split(r'(?=^###\s+[A-Z]+-\d+)', content, flags=re.MULTILINE)
+        story_blocks = self.PRD_STORY_SPLIT_PATTERN.split(content)
         for block in story_blocks:
-            if not block.strip() or not re.match(r'^###\s+[A-Z]+-\d+', block):
+            story_id_match = self.PRD_STORY_HEADER_PATTERN.match(block)
+            if not block.strip() or not story_id_match:
                 continue
 
-            story_id_match = re.match(r'^###\s+([A-Z]+-\d+)', block)
-            story_id = story_id_match.group(1) if story_id_match else "Unknown"
+            story_id = story_id_match.group(1)
 
             if not self.PRD_STATUS_PATTERN.search(block):
                 result.warnings.append(f"{story_id}: Missing **Status:** field")
@@ -188,10 +211,10 @@ class GeneratorValidator:
         errors: list[str] = []
 
         # Check for required sections
-        if not re.search(r'^##\s+Objective', content, re.MULTILINE | re.IGNORECASE):
+        if not self.OBJECTIVE_SECTION_PATTERN.search(content):
             errors.append("Overview: Missing Objective section")
 
-        if not re.search(r'^##\s+Phased\s+Approach', content, re.MULTILINE | re.IGNORECASE):
+        if not self.PHASED_APPROACH_SECTION_PATTERN.search(content):
             errors.append("Overview: Missing Phased Approach section")
 
         # Check for phase table
@@ -205,14 +228,14 @@ class GeneratorValidator:
         result = ValidationResult(valid=True)
 
         # Check for phase header
-        if not re.search(r'^#\s+Phase\s+\d+', content, re.MULTILINE):
+        if not self.PHASE_HEADER_PATTERN.search(content):
             result.warnings.append(f"{filename}: Missing 'Phase N:' header")
 
         # Check for required sections
-        if not re.search(r'^##\s+Objective', content, re.MULTILINE | re.IGNORECASE):
+        if not self.OBJECTIVE_SECTION_PATTERN.search(content):
             result.warnings.append(f"{filename}: Missing Objective section")
 
-        if not re.search(r'^##\s+Tasks', content, re.MULTILINE | re.IGNORECASE):
+        if not self.TASKS_SECTION_PATTERN.search(content):
             result.errors.append(f"{filename}: Missing Tasks section")
 
         # Extract task IDs
@@ -245,13 +268,9 @@ class GeneratorValidator:
     ) -> list[str]:
         """Validate all dependencies reference existing tasks."""
         errors: list[str] = []
-        dep_pattern = re.compile(
-            r'^\s*-?\s*Dependenc(?:y|ies):\s*(.+?)$',
-            re.MULTILINE | re.IGNORECASE
-        )
 
         for filename, content in files.items():
-            for match in dep_pattern.finditer(content):
+            for match in self.DEPENDENCY_PATTERN.finditer(content):
                 deps_str = match.group(1).strip()
                 if deps_str.lower() == "none":
                     continue
@@ -62,8 +62,8 @@ class PlansInput(InputSource):
         elif not path.is_dir():
             errors.append(f"Not a directory: {self.plans_dir}")
         else:
-            md_files = list(path.glob(self.pattern))
-            if not md_files:
+            # Only need to know one match exists; stop the scan there
+            if next(path.glob(self.pattern), None) is None:
                 errors.append(f"No plan files matching '{self.pattern}' found")
 
         return errors
@@ -64,8 +64,7 @@ class PRDInput(InputSource):
                 errors.append(f"PRD file should be markdown: {self.prd_path}")
         elif path.is_dir():
             # Directory validation
-            md_files = list(path.glob("*.md"))
-            if not md_files:
+            if next(path.glob("*.md"), None) is None:
                 errors.append(f"No markdown files found in directory: {self.prd_path}")
         else:
             errors.append(f"Path is neither file nor directory: {self.prd_path}")
@@ -1,12 +1,15 @@
 """Checkbox updating for markdown files."""
 
 import re
+from collections.abc import Iterable
 from pathlib import Path
 
 
 class CheckboxUpdater:
     """Updates checkbox status in markdown files."""
 
+    CHECKBOX_LINE_PATTERN = re.compile(r'^(\s*-\s+\[)([ xX])(\].+)$')
+
     @classmethod
     def update_task_by_line(
         cls,
@@ -25,22 +28,42 @@ class CheckboxUpdater:
         Returns:
             Updated content
         """
-        lines = content.split('\n')
-        if line_number < 1 or line_number > len(lines):
-            return content
+        return cls.update_task_by_lines(content, [line_number], completed)
+
+    @classmethod
+    def update_task_by_lines(
+        cls,
+        content: str,
+        line_numbers: Iterable[int],
+        completed: bool
+    ) -> str:
+        """
+        Update the checkbox status at several lines in one pass.
 
-        line = lines[line_number - 1]
+        Args:
+            content: Markdown content
+            line_numbers: 1-based line numbers; out-of-range ones are ignored
+            completed: True to check, False to uncheck
+
+        Returns:
+            Updated content
+        """
+        lines = content.split('\n')
         new_status = 'x' if completed else ' '
+        changed = False
 
-        # Replace checkbox on this line
-        updated_line = re.sub(
-            r'^(\s*-\s+\[)([ xX])(\].+)$',
-            rf'\g<1>{new_status}\g<3>',
-            line
-        )
+        for line_number in line_numbers:
+            if line_number < 1 or line_number > len(lines):
+                continue
 
-        lines[line_number - 1] = updated_line
-        return '\n'.join(lines)
+            # Replace checkbox on this line
+            lines[line_number - 1] = cls.CHECKBOX_LINE_PATTERN.sub(
+                rf'\g<1>{new_status}\g<3>',
+                lines[line_number - 1]
+            )
+            changed = True
+
+        return '\n'.join(lines) if changed else content
 
     @classmethod
     def update_file_by_line(
@@ -57,6 +80,26 @@ class CheckboxUpdater:
             line_number: Line number to update
             completed: New status
 
+        Returns:
+            True if file was modified, False otherwise
+        """
+        return cls.update_file_by_lines(file_path, [line_number], completed)
+
+    @classmethod
+    def update_file_by_lines(
+        cls,
+        file_path: str,
+        line_numbers: Iterable[int],
+        completed: bool
+    ) -> bool:
+        """
+        Update checkboxes at several lines in a file with one read and write.
+
+        Args:
+            file_path: Path to markdown file
+            line_numbers: Line numbers to update
+            completed: New status
+
         Returns:
             True if file was modified, False otherwise
         """
@@ -65,7 +108,7 @@ class CheckboxUpdater:
             return False
 
         original_content = path.read_text(encoding='utf-8')
-        updated_content = cls.update_task_by_line(original_content, line_number, completed)
+        updated_content = cls.update_task_by_lines(original_content, line_numbers, completed)
 
         if updated_content != original_content:
             path.write_text(updated_content, encoding='utf-8')
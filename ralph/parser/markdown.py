@@ -4,10 +4,15 @@ Uses unified plan format with `- [ ] TASK-XXX:` checkboxes for tasks.
 Multi-file structure: 00-overview.md, 01-phase.md, etc.
 """
 
+import hashlib
+import json
+import os
 import re
+import shutil
 from pathlib import Path
 from typing import Optional
 
+from .. import __version__
 from ..state.models import Phase, Project, Task, TaskStatus
 
 
@@ -32,6 +37,43 @@ class MarkdownParser:
         re.MULTILINE
     )
 
+    # Header patterns
+    PROJECT_NAME_PATTERN = re.compile(
+        r'^#\s+(?:Project:\s*)?(.+?)$',
+        re.MULTILINE
+    )
+    TITLE_PATTERN = re.compile(r'^#\s+(.+?)$', re.MULTILINE)
+    PHASE_PREFIX_PATTERN = re.compile(r'^Phase\s+\d+[:\s]*')
+
+    # Line patterns for one-file-per-phase plans (explicit IDs, bold labels)
+    PHASE_FILE_TASK_PATTERN = re.compile(
+        r'^(\s*)-\s+\[([ xX])\]\s+([A-Z]+-\d+)[:\s]+(.+?)$'
+    )
+    PHASE_FILE_PRIORITY_PATTERN = re.compile(
+        r'^\s*-?\s*\*?\*?Priority\*?\*?:\s*(\d+|high|medium|low)',
+        re.IGNORECASE
+    )
+    PHASE_FILE_DEPENDENCY_PATTERN = re.compile(
+        r'^\s*-?\s*\*?\*?Dependenc(?:y|ies)\*?\*?:\s*(.+?)$',
+        re.IGNORECASE
+    )
+    PHASE_FILE_DESCRIPTION_PATTERN = re.compile(
+        r'^\s*-?\s*\*?\*?Description\*?\*?:\s*(.+?)$'
+    )
+
+    # Line patterns for single-file plans
+    PHASE_LINE_PATTERN = re.compile(r'^##\s+(.+?)$')
+    PHASE_NUMBER_PATTERN = re.compile(r'Phase\s+\d+[:\s]*(.+)?')
+    PRIORITY_LINE_PATTERN = re.compile(
+        r'^\s*-?\s*Priority:\s*(\d+|high|medium|low)$',
+        re.IGNORECASE
+    )
+    DEPENDENCY_LINE_PATTERN = re.compile(
+        r'^\s*-?\s*Dependenc(?:y|ies):\s*(.+?)$',
+        re.IGNORECASE
+    )
+    DESCRIPTION_LINE_PATTERN = re.compile(r'^\s*-?\s*Description:\s*(.+?)$')
+
     def __init__(self, source_file: Optional[str] = None):
         self.source_file = source_file
 
@@ -44,12 +86,67 @@ class MarkdownParser:
         content = path.read_text(encoding='utf-8')
         return self.parse_content(content, str(path))
 
+    def parse_file_cached(self, file_path: str, cache_dir: Path) -> Project:
+        """Parse a markdown file, reusing a cached result while its content is unchanged.
+
+        Each file gets a single JSON entry under ``cache_dir/<ralph version>/``,
+        named by a BLAKE2 digest of its resolved path and holding a digest of the
+        content it was parsed from, so an edit replaces the entry rather than
+        adding one. Directories left by other Ralph versions are removed when an
+        entry is written. Source paths in the result are the resolved path. The
+        cache is best-effort: unreadable or unwritable entries fall back to a
+        normal parse.
+        """
+        path = Path(file_path).resolve()
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {file_path}") from None
+
+        source = str(path)
+        content_digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        path_digest = hashlib.blake2b(source.encode('utf-8'), digest_size=16).hexdigest()
+        version_dir = cache_dir / __version__
+        cache_file = version_dir / f"{path_digest}.json"
+
+        try:
+            with open(cache_file, encoding='utf-8') as f:
+                entry = json.load(f)
+            if entry["digest"] == content_digest:
+                project = Project.from_dict(entry["project"])
+                self.source_file = source
+                return project
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        # Same newline translation read_text() applies
+        content = data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+        project = self.parse_content(content, source)
+
+        try:
+            version_dir.mkdir(parents=True, exist_ok=True)
+            temp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            temp_file.write_text(
+                json.dumps({"digest": content_digest, "project": project.to_dict()}),
+                encoding='utf-8'
+            )
+            os.replace(temp_file, cache_file)
+
+            # Drop caches written by other Ralph versions
+            for entry_dir in cache_dir.iterdir():
+                if entry_dir.name != __version__ and entry_dir.is_dir():
+                    shutil.rmtree(entry_dir, ignore_errors=True)
+        except OSError:
+            pass
+
+        return project
+
     def parse_content(self, content: str, source_file: Optional[str] = None) -> Project:
         """Parse markdown content and return a Project."""
         self.source_file = source_file
 
         # Extract project name from first H1 header
-        name_match = re.search(r'^#\s+(?:Project:\s*)?(.+?)$', content, re.MULTILINE)
+        name_match = self.PROJECT_NAME_PATTERN.search(content)
         project_name = name_match.group(1).strip() if name_match else "Unnamed Project"
 
         project = Project(name=project_name)
@@ -122,11 +219,11 @@ class MarkdownParser:
             Tuple of (Phase or None, updated task counter)
         """
         # Extract phase name from H1 header or filename
-        name_match = re.search(r'^#\s+(.+?)$', content, re.MULTILINE)
+        name_match = self.TITLE_PATTERN.search(content)
         if name_match:
             phase_name = name_match.group(1).strip()
             # Clean up phase name (remove "Phase N:" prefix)
-            phase_name = re.sub(r'^Phase\s+\d+[:\s]*', '', phase_name).strip()
+            phase_name = self.PHASE_PREFIX_PATTERN.sub('', phase_name).strip()
         else:
             # Use filename without extension
             phase_name = Path(source_file).stem
@@ -145,10 +242,7 @@ class MarkdownParser:
 
         for line_num, line in enumerate(lines, 1):
             # Check for task checkbox - MUST have explicit TASK-XXX ID
-            task_match = re.match(
-                r'^(\s*)-\s+\[([ xX])\]\s+([A-Z]+-\d+)[:\s]+(.+?)$',
-                line
-            )
+            task_match = self.PHASE_FILE_TASK_PATTERN.match(line)
             if task_match:
                 indent = len(task_match.group(1))
                 is_completed = task_match.group(2).lower() == 'x'
@@ -176,10 +270,7 @@ class MarkdownParser:
             # Check for task metadata (under current task)
             if current_task:
                 # Priority
-                priority_match = re.match(
-                    r'^\s*-?\s*\*?\*?Priority\*?\*?:\s*(\d+|high|medium|low)',
-                    line, re.IGNORECASE
-                )
+                priority_match = self.PHASE_FILE_PRIORITY_PATTERN.match(line)
                 if priority_match:
                     priority_val = priority_match.group(1).lower()
                     if priority_val == 'high':
@@ -193,10 +284,7 @@ class MarkdownParser:
                     continue
 
                 # Dependencies
-                dep_match = re.match(
-                    r'^\s*-?\s*\*?\*?Dependenc(?:y|ies)\*?\*?:\s*(.+?)$',
-                    line, re.IGNORECASE
-                )
+                dep_match = self.PHASE_FILE_DEPENDENCY_PATTERN.match(line)
                 if dep_match:
                     deps = [
                         d.strip() for d in dep_match.group(1).split(',')
@@ -206,10 +294,7 @@ class MarkdownParser:
                     continue
 
                 # Description
-                desc_match = re.match(
-                    r'^\s*-?\s*\*?\*?Description\*?\*?:\s*(.+?)$',
-                    line
-                )
+                desc_match = self.PHASE_FILE_DESCRIPTION_PATTERN.match(line)
                 if desc_match:
                     current_task.description = desc_match.group(1).strip()
                     continue
@@ -241,7 +326,7 @@ class MarkdownParser:
 
         for line_num, line in enumerate(lines, 1):
             # Check for phase header (## Phase X: Name or ## Name)
-            phase_match = re.match(r'^##\s+(.+?)$', line)
+            phase_match = self.PHASE_LINE_PATTERN.match(line)
             if phase_match:
                 # Save previous phase if exists
                 if current_phase:
@@ -253,7 +338,7 @@ class MarkdownParser:
                 phase_id = f"phase-{global_phase_counter}"
 
                 # Clean up phase name if it has "Phase N:" prefix
-                phase_num_match = re.match(r'Phase\s+\d+[:\s]*(.+)?', phase_name)
+                phase_num_match = self.PHASE_NUMBER_PATTERN.match(phase_name)
                 if phase_num_match:
                     phase_name = phase_num_match.group(1) or phase_name
 
@@ -268,7 +353,7 @@ class MarkdownParser:
                 continue
 
             # Check for task checkbox
-            task_match = re.match(r'^(\s*)-\s+\[([ xX])\]\s+(?:([A-Z]+-\d+)[:\s]+)?(.+?)$', line)
+            task_match = self.TASK_CHECKBOX_PATTERN.match(line)
             if task_match and current_phase:
                 indent = len(task_match.group(1))
                 is_completed = task_match.group(2).lower() == 'x'
@@ -304,8 +389,7 @@ class MarkdownParser:
             # Check for task metadata (under current task)
             if current_task:
                 # Priority
-                priority_pattern = r'^\s*-?\s*Priority:\s*(\d+|high|medium|low)$'
-                priority_match = re.match(priority_pattern, line, re.IGNORECASE)
+                priority_match = self.PRIORITY_LINE_PATTERN.match(line)
                 if priority_match:
                     priority_val = priority_match.group(1).lower()
                     if priority_val == 'high':
@@ -319,7 +403,7 @@ class MarkdownParser:
                     continue
 
                 # Dependencies
-                dep_match = re.match(r'^\s*-?\s*Dependenc(?:y|ies):\s*(.+?)$', line, re.IGNORECASE)
+                dep_match = self.DEPENDENCY_LINE_PATTERN.match(line)
                 if dep_match:
                     deps = [
                         d.strip() for d in dep_match.group(1).split(',')
@@ -329,7 +413,7 @@ class MarkdownParser:
                     continue
 
                 # Description
-                desc_match = re.match(r'^\s*-?\s*Description:\s*(.+?)$', line)
+                desc_match = self.DESCRIPTION_LINE_PATTERN.match(line)
                 if desc_match:
                     current_task.description = desc_match.group(1).strip()
                     continue
@@ -371,7 +455,7 @@ class MarkdownParser:
         errors: list[str] = []
 
         # Check for project title
-        if not re.search(r'^#\s+.+$', content, re.MULTILINE):
+        if not self.TITLE_PATTERN.search(content):
             errors.append("Missing project title (# heading)")
 
         # Check for at least one phase
@@ -0,0 +1,39 @@
+"""JSON encoding for state files.
+
+Uses orjson when it is installed (``pip install ralph-agent[fast]``) and
+falls back to the standard library otherwise. Both paths read and write the
+same format, so state files move freely between installs.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode a JSON document.
+
+    Raises:
+        json.JSONDecodeError: If the document is malformed (orjson's error
+            type subclasses it).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Encode an object as UTF-8 JSON, optionally indented by two spaces."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+def load_file(path: Any) -> Any:
+    """Read and decode a JSON file."""
+    with open(path, "rb") as f:
+        return loads(f.read())
@@ -269,11 +269,24 @@ class Project:
             if t.status == TaskStatus.COMPLETED
         )
 
+    @property
+    def progress_counts(self) -> tuple[int, int]:
+        """Total and completed task counts, gathered in one pass over the phases.
+
+        Computed on each access (tasks are mutated in place), so read it once
+        where both numbers are needed.
+        """
+        total = completed = 0
+        for p in self.phases:
+            total += len(p.tasks)
+            completed += sum(1 for t in p.tasks if t.status == TaskStatus.COMPLETED)
+        return total, completed
+
     @property
     def progress(self) -> float:
         """Overall completion percentage."""
-        total = self.total_tasks
-        return self.completed_tasks / total if total > 0 else 0.0
+        total, completed = self.progress_counts
+        return completed / total if total > 0 else 0.0
 
     @property
     def current_iteration(self) -> int:
@@ -287,6 +300,7 @@ class Project:
 
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
+        total, completed = self.progress_counts
         return {
             "version": self.version,
             "name": self.name,
@@ -297,8 +311,8 @@ class Project:
             "phases": [p.to_dict() for p in self.phases],
             "iterations": [i.to_dict() for i in self.iterations],
             "source_files": self.source_files,
-            "total_tasks": self.total_tasks,
-            "completed_tasks": self.completed_tasks,
+            "total_tasks": total,
+            "completed_tasks": completed,
         }
 
     @classmethod
@@ -393,13 +407,14 @@ class Project:
 
     def get_summary(self) -> dict:
         """Get a summary of project status."""
+        total, completed = self.progress_counts
         return {
             "name": self.name,
             "status": self.status.value,
             "total_phases": len(self.phases),
-            "total_tasks": self.total_tasks,
-            "completed_tasks": self.completed_tasks,
-            "progress_percent": round(self.progress * 100, 1),
+            "total_tasks": total,
+            "completed_tasks": completed,
+            "progress_percent": round(completed / total * 100, 1) if total else 0.0,
             "iterations_run": len(self.iterations),
             "current_phase": (phase.name if (phase := self.get_current_phase()) else None),
             "next_task": (task.name if (task := self.get_next_task()) else None),
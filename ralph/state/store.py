@@ -5,6 +5,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from . import codec
 from .identity import ProjectIdentity
 from .models import Iteration, Phase, Project, Task, TaskStatus
 
@@ -59,6 +60,8 @@ class StateStore:
         self.state_file = self.state_dir / self.DEFAULT_STATE_FILE
         self.status_file = self.state_dir / self.STATUS_FILE
         self._project: Optional[Project] = None
+        # Set when the project was changed in place without a save
+        self._dirty = False
 
     @property
     def project(self) -> Optional[Project]:
@@ -82,8 +85,7 @@ class StateStore:
             return None
 
         try:
-            with open(self.state_file) as f:
-                data = json.load(f)
+            data = codec.load_file(self.state_file)
             self._project = Project.from_dict(data)
             return self._project
         except (json.JSONDecodeError, KeyError, ValueError) as e:
@@ -104,11 +106,21 @@ class StateStore:
 
         # Write atomically with temp file
         temp_file = self.state_file.with_suffix('.tmp')
-        with open(temp_file, 'w') as f:
-            json.dump(self._project.to_dict(), f, indent=2)
+        with open(temp_file, 'wb') as f:
+            f.write(codec.dumps(self._project.to_dict(), indent=True))
 
         # Atomic rename
         temp_file.replace(self.state_file)
+        self._dirty = False
+
+    def mark_dirty(self) -> None:
+        """Note an in-place change to the project that still needs saving."""
+        self._dirty = True
+
+    def save_if_dirty(self) -> None:
+        """Save only if the project changed since the last save."""
+        if self._dirty:
+            self.save()
 
     def create_project(self, name: str, description: str = "") -> Project:
         """Create a new project."""
@@ -341,8 +353,7 @@ class StateStore:
                 continue
 
             try:
-                with open(state_file) as f:
-                    data = json.load(f)
+                data = codec.load_file(state_file)
                 projects.append({
                     'project_id': project_dir.name,
                     'name': data.get('name', 'Unknown'),
@@ -394,8 +405,7 @@ class StateStore:
             return None, None
 
         try:
-            with open(state_file) as f:
-                data = json.load(f)
+            data = codec.load_file(state_file)
 
             project = Project.from_dict(data)
 
@@ -459,8 +469,7 @@ class StateStore:
         if not backup_path.exists():
             raise FileNotFoundError(f"Backup file not found: {backup_path}")
 
-        with open(backup_path) as f:
-            data = json.load(f)
+        data = codec.load_file(backup_path)
 
         self._project = Project.from_dict(data)
         self.save()
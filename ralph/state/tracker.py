@@ -1,6 +1,8 @@
 """Progress tracking for Ralph CLI."""
 
+from collections.abc import Iterator
 from datetime import datetime
+from itertools import islice
 from typing import Callable, Optional
 
 from .models import Iteration, Phase, Project, Task, TaskStatus
@@ -132,12 +134,13 @@ class ProgressTracker:
 
         current_phase = self.project.get_current_phase()
         next_task = self.project.get_next_task()
+        total, completed = self.project.progress_counts
 
         return {
             "status": self.project.status.value,
-            "total_tasks": self.project.total_tasks,
-            "completed_tasks": self.project.completed_tasks,
-            "progress_percent": round(self.project.progress * 100, 1),
+            "total_tasks": total,
+            "completed_tasks": completed,
+            "progress_percent": round(completed / total * 100, 1) if total else 0.0,
             "current_iteration": (
                 self._current_iteration.number
                 if self._current_iteration else self.project.current_iteration
@@ -210,14 +213,15 @@ class ProgressTracker:
                     })
         return tasks
 
-    def get_iteration_history(self, limit: int = 10) -> list[dict]:
-        """Get history of recent iterations."""
+    def get_iteration_history(self, limit: int = 10) -> Iterator[dict]:
+        """Yield recent iterations, newest first."""
         if not self.project:
-            return []
+            return
 
-        iterations = self.project.iterations[-limit:]
-        return [
-            {
+        # Iterations are appended in order, so the newest are at the end; islice
+        # avoids copying the list and keeps limit=0 from meaning "everything"
+        for it in islice(reversed(self.project.iterations), max(limit, 0)):
+            yield {
                 "number": it.number,
                 "started_at": it.started_at.isoformat(),
                 "ended_at": it.ended_at.isoformat() if it.ended_at else None,
@@ -226,8 +230,6 @@ class ProgressTracker:
                 "tasks_completed": it.tasks_completed,
                 "error": it.error,
             }
-            for it in reversed(iterations)
-        ]
 
     def _notify_progress(self, event: str, data: dict) -> None:
         """Notify progress callback with an event."""
@@ -243,9 +245,10 @@ class ProgressTracker:
         if not self.project:
             return "[" + " " * width + "] 0%"
 
-        filled = int(self.project.progress * width)
+        progress = self.project.progress
+        filled = int(progress * width)
         bar = "#" * filled + "-" * (width - filled)
-        percent = round(self.project.progress * 100, 1)
+        percent = round(progress * 100, 1)
         return f"[{bar}] {percent}%"
 
     def format_status_line(self) -> str:
@@ -1,15 +1,16 @@
 """Rich terminal UI components for Ralph CLI."""
 
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from rich.box import DOUBLE, HEAVY, ROUNDED
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
 from rich.text import Text
 
+if TYPE_CHECKING:
+    from rich.progress import Progress
+
 console = Console()
 
 
@@ -41,6 +42,9 @@ class RalphUI:
 
     def print_config(self, max_iterations: int, idle_timeout: int, plans_dir: str) -> None:
         """Print configuration summary."""
+        # rich.table drags in fractions/decimal; only the interactive run banner needs it
+        from rich.table import Table
+
         table = Table(box=ROUNDED, border_style="dim")
         table.add_column("Setting", style="cyan")
         table.add_column("Value", style="white")
@@ -178,8 +182,11 @@ class RalphUI:
         """Print a status update."""
         self.console.print(f"  [dim]→ {status}[/dim]")
 
-    def create_spinner(self, message: str) -> Progress:
+    def create_spinner(self, message: str) -> "Progress":
         """Create a spinner progress indicator."""
+        # rich.progress pulls in live/rendering machinery; load it only when needed
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+
         return Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),